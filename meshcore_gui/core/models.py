@@ -176,6 +176,10 @@ class Message:
         tag is omitted (useful when the panel header already indicates
         the active channel).
 
+        The line only varies with the channel tag, so results are
+        memoised per tag on the instance (outside the dataclass fields,
+        so ``asdict`` and equality are unaffected).
+
         Args:
             channel_names: Optional ``{channel_idx: name}`` lookup.
                 Falls back to ``self.channel_name``, then ``'ch<idx>'``.
@@ -185,8 +189,6 @@ class Message:
         Returns:
             Formatted single-line string.
         """
-        direction = '→' if self.direction == 'out' else '←'
-
         ch_label = ''
         if show_channel:
             if self.channel is not None:
@@ -200,6 +202,16 @@ class Message:
             else:
                 ch_label = '[DM] '
 
+        lines = self.__dict__.setdefault('_lines', {})
+        line = lines.get(ch_label)
+        if line is None:
+            line = lines[ch_label] = self._format_line(ch_label)
+        return line
+
+    def _format_line(self, ch_label: str) -> str:
+        """Build the display line for a resolved channel tag."""
+        direction = '→' if self.direction == 'out' else '←'
+
         if self.direction == 'in' and self.path_len > 0:
             hop_tag = f'[{self.path_len}h{"✓" if self.path_hashes else ""}] '
         else:
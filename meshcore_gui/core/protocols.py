@@ -72,6 +72,14 @@ class SharedDataWriter(Protocol):
 # Reader — used by DashboardPage
 # ----------------------------------------------------------------------
 
+# Bits of the snapshot's ``dirty_flags`` field: one per update flag,
+# packed under the lock so readers test a single int per tick.
+DIRTY_DEVICE = 1 << 0
+DIRTY_CONTACTS = 1 << 1
+DIRTY_CHANNELS = 1 << 2
+DIRTY_RXLOG = 1 << 3
+
+
 @runtime_checkable
 class SharedDataReader(Protocol):
     """Read-side interface used by GUI pages.
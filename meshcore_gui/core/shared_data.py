@@ -17,10 +17,16 @@ v4.1 changes
 import queue
 import threading
 from dataclasses import asdict
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from meshcore_gui.config import debug_print
 from meshcore_gui.core.models import DeviceInfo, Message, RxLogEntry
+from meshcore_gui.core.protocols import (
+    DIRTY_CHANNELS,
+    DIRTY_CONTACTS,
+    DIRTY_DEVICE,
+    DIRTY_RXLOG,
+)
 from meshcore_gui.services.message_archive import MessageArchive
 
 
@@ -61,6 +67,17 @@ class SharedData:
         self.channels_updated: bool = True
         self.rxlog_updated: bool = True
 
+        # Per-section change counters, bumped on every mutation and
+        # exposed in the snapshot as ``<section>_version``.  Unchanged
+        # sections reuse the previous snapshot copy (see _cached_copy).
+        self._contacts_version: int = 0
+        self._channels_version: int = 0
+        self._messages_version: int = 0
+        self._rxlog_version: int = 0
+        self._rooms_version: int = 0
+        self._bot_version: int = 0
+        self._copy_cache: Dict[str, Tuple[int, Any]] = {}
+
         # Flag to track if GUI has done first render
         self.gui_initialized: bool = False
 
@@ -134,6 +151,7 @@ class SharedData:
     def set_bot_enabled(self, enabled: bool) -> None:
         with self.lock:
             self.bot_enabled = enabled
+            self._bot_version += 1
             debug_print(f"BOT {'enabled' if enabled else 'disabled'}")
 
     def is_bot_enabled(self) -> bool:
@@ -211,6 +229,7 @@ class SharedData:
                 'state': state,
                 'detail': detail,
             }
+            self._rooms_version += 1
             debug_print(
                 f"Room login state: {pubkey_prefix[:12]}… → {state}"
                 f"{(' (' + detail + ')') if detail else ''}"
@@ -245,6 +264,7 @@ class SharedData:
         with self.lock:
             messages = [Message.from_dict(d) for d in archived]
             self._room_msg_cache[norm] = messages
+            self._rooms_version += 1
             debug_print(
                 f"Room history loaded: {norm}… → {len(messages)} messages"
             )
@@ -283,12 +303,14 @@ class SharedData:
         with self.lock:
             self.contacts = contacts_dict.copy()
             self.contacts_updated = True
+            self._contacts_version += 1
             debug_print(f"Contacts updated: {len(self.contacts)} contacts")
 
     def set_channels(self, channels: List[Dict]) -> None:
         with self.lock:
             self.channels = channels.copy()
             self.channels_updated = True
+            self._channels_version += 1
             debug_print(f"Channels updated: {[c['name'] for c in channels]}")
 
     @staticmethod
@@ -344,6 +366,7 @@ class SharedData:
                 msg.path_names = self._resolve_path_names(msg.path_hashes)
 
             self.messages.append(msg)
+            self._messages_version += 1
             for fp in fps:
                 self._message_fingerprints.add(fp)
 
@@ -369,6 +392,7 @@ class SharedData:
                 norm = msg.sender_pubkey[:12]
                 if norm in self._room_msg_cache:
                     self._room_msg_cache[norm].append(msg)
+                    self._rooms_version += 1
             
             # Archive message for persistent storage
             if self.archive:
@@ -425,6 +449,7 @@ class SharedData:
             if len(self.rx_log) > 50:
                 self.rx_log.pop()
             self.rxlog_updated = True
+            self._rxlog_version += 1
             
             # Archive entry for persistent storage
             if self.archive:
@@ -462,6 +487,7 @@ class SharedData:
             # idempotent behaviour on repeated calls (reconnect).
             self.messages.clear()
             self._message_fingerprints.clear()
+            self._messages_version += 1
 
             # recent is newest-first; reverse so oldest is appended first
             for msg_dict in reversed(recent):
@@ -494,6 +520,13 @@ class SharedData:
         Returns a plain dict with typed objects inside.  The
         ``messages`` and ``rx_log`` values are lists of dataclass
         instances (not dicts).
+
+        Collections are copied only when their section changed since
+        the previous snapshot; otherwise the earlier copy is returned
+        again, so callers must treat them as read-only.  The
+        ``*_version`` keys identify each section's state, and
+        ``dirty_flags`` packs the four update flags into ``DIRTY_*``
+        bits (see ``protocols``).
         """
         with self.lock:
             return self._build_snapshot_unlocked()
@@ -512,15 +545,41 @@ class SharedData:
         """
         with self.lock:
             snapshot = self._build_snapshot_unlocked()
-            self.device_updated = False
-            self.contacts_updated = False
-            self.channels_updated = False
-            self.rxlog_updated = False
+            # Idle ticks have nothing to reset
+            if snapshot['dirty_flags']:
+                self.device_updated = False
+                self.contacts_updated = False
+                self.channels_updated = False
+                self.rxlog_updated = False
             return snapshot
 
+    def _cached_copy(
+        self, section: str, version: int, make: Callable[[], Any],
+    ) -> Any:
+        """Return the snapshot copy of *section* for *version*.
+
+        MUST be called with self.lock held.  *make* builds a fresh copy
+        and only runs when the section changed since the last snapshot.
+        """
+        cached = self._copy_cache.get(section)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        copy = make()
+        self._copy_cache[section] = (version, copy)
+        return copy
+
+    def _copy_room_login_states(self) -> Dict[str, Dict]:
+        """Copy room login states.  MUST be called with self.lock held."""
+        return {k: v.copy() for k, v in self.room_login_states.items()}
+
+    def _copy_room_messages(self) -> Dict[str, List[Message]]:
+        """Copy the room message cache.  MUST be called with self.lock held."""
+        return {k: list(v) for k, v in self._room_msg_cache.items()}
+
     def _build_snapshot_unlocked(self) -> Dict:
         """Build the snapshot dict.  MUST be called with self.lock held."""
         d = self.device
+        rooms_version = self._rooms_version
         return {
             # DeviceInfo fields (flat for backward compat)
             'name': d.name,
@@ -535,31 +594,51 @@ class SharedData:
             # Status
             'connected': self.connected,
             'status': self.status,
-            # Collections (typed copies)
-            'contacts': self.contacts.copy(),
-            'channels': self.channels.copy(),
-            'messages': self.messages.copy(),
-            'rx_log': self.rx_log.copy(),
+            # Collections (typed copies, shared while unchanged)
+            'contacts': self._cached_copy(
+                'contacts', self._contacts_version, self.contacts.copy,
+            ),
+            'channels': self._cached_copy(
+                'channels', self._channels_version, self.channels.copy,
+            ),
+            'messages': self._cached_copy(
+                'messages', self._messages_version, self.messages.copy,
+            ),
+            'rx_log': self._cached_copy(
+                'rx_log', self._rxlog_version, self.rx_log.copy,
+            ),
+            # Section versions
+            'contacts_version': self._contacts_version,
+            'channels_version': self._channels_version,
+            'messages_version': self._messages_version,
+            'rxlog_version': self._rxlog_version,
+            'rooms_version': rooms_version,
             # Flags
             'device_updated': self.device_updated,
             'contacts_updated': self.contacts_updated,
             'channels_updated': self.channels_updated,
             'rxlog_updated': self.rxlog_updated,
+            'dirty_flags': (
+                (DIRTY_DEVICE if self.device_updated else 0)
+                | (DIRTY_CONTACTS if self.contacts_updated else 0)
+                | (DIRTY_CHANNELS if self.channels_updated else 0)
+                | (DIRTY_RXLOG if self.rxlog_updated else 0)
+            ),
             'gui_initialized': self.gui_initialized,
             'bot_enabled': self.bot_enabled,
+            'bot_version': self._bot_version,
             'auto_add_enabled': self.auto_add_enabled,
             # Archive (for archive viewer)
             'archive': self.archive,
             # Room login states
-            'room_login_states': {
-                k: v.copy()
-                for k, v in self.room_login_states.items()
-            },
+            'room_login_states': self._cached_copy(
+                'room_login_states', rooms_version,
+                self._copy_room_login_states,
+            ),
             # Room message cache (archived + live)
-            'room_messages': {
-                k: list(v)
-                for k, v in self._room_msg_cache.items()
-            },
+            'room_messages': self._cached_copy(
+                'room_messages', rooms_version, self._copy_room_messages,
+            ),
         }
 
     def clear_update_flags(self) -> None:
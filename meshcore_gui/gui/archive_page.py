@@ -4,13 +4,22 @@ Archive viewer page for MeshCore GUI.
 Displays archived messages with filters and pagination.
 """
 
+import threading
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from nicegui import ui
 
 from meshcore_gui.core.models import Message
 from meshcore_gui.core.protocols import SharedDataReadAndLookup
+from meshcore_gui.services.message_archive import MessageArchive
+
+
+# Emits the data-idx of the clicked message row (if any) to the server
+_ROW_CLICK_JS = (
+    '(e) => { const row = e.target.closest("[data-idx]"); '
+    'if (row) emit(row.dataset.idx); }'
+)
 
 
 class ArchivePage:
@@ -21,7 +30,10 @@ class ArchivePage:
     Channel filtering is driven by the drawer submenu via
     :meth:`set_channel_filter`.
     """
-    
+
+    # Maximum number of cached query pages
+    _PAGE_CACHE_SIZE = 8
+
     def __init__(self, shared: SharedDataReadAndLookup, page_size: int = 50):
         """Initialize archive page.
         
@@ -31,6 +43,7 @@ class ArchivePage:
         """
         self._shared = shared
         self._page_size = page_size
+        self._archive: Optional[MessageArchive] = None
         
         # Current page state
         self._current_page = 0
@@ -45,6 +58,27 @@ class ArchivePage:
         self._text_input = None
         self._days_select = None
 
+        # Persistent pagination widgets (created once in render(),
+        # only their text / enabled state changes on refresh)
+        self._count_label = None
+        self._pagers: list = []
+        self._total_pages = 0
+
+        # Query results keyed by (archive version, filters, page).
+        # Filled on demand and by background prefetch of adjacent pages.
+        self._page_cache: Dict[tuple, Tuple[list, int]] = {}
+        self._cache_lock = threading.Lock()
+
+        # Prefetch worker: one daemon thread (started on first use) that
+        # runs the latest requested job; a newer request replaces a job
+        # that has not started yet.  Shares the cache lock.
+        self._prefetch_cond = threading.Condition(self._cache_lock)
+        self._prefetch_job: Optional[tuple] = None
+        self._prefetch_thread: Optional[threading.Thread] = None
+
+        # Message hashes of the rendered rows, indexed by data-idx
+        self._row_hashes: List[str] = []
+
     # -- Channel filter (set by dashboard submenu) ---------------------
 
     def set_channel_filter(self, channel) -> None:
@@ -92,10 +126,60 @@ class ArchivePage:
             # Filters (days + text search — channel is driven by submenu)
             self._render_filters()
             
+            # Pagination header: result count (left) + pager (right)
+            with ui.row().classes('w-full items-center justify-between'):
+                self._count_label = ui.label('').classes(
+                    'text-sm text-gray-600'
+                )
+                self._render_pager('gap-2')
+
             # Messages container (refreshed inline)
             self._msg_outer = ui.column().classes(
                 'w-full gap-2 flex-grow'
             ).style('overflow: hidden; min-height: 0')
+
+            # Pagination footer
+            with ui.row().classes('w-full items-center justify-center mt-4'):
+                self._render_pager('')
+
+            self._refresh_messages()
+
+    def _render_pager(self, classes: str) -> None:
+        """Render one Previous / page / Next control group.
+
+        The widgets are created once; :meth:`_update_pagers` only
+        toggles their text and enabled state on each refresh.
+        """
+        row = ui.row().classes(f'items-center {classes}')
+        with row:
+            prev_btn = ui.button('Previous', on_click=self._go_prev).props('flat')
+            page_label = ui.label('').classes('mx-2')
+            next_btn = ui.button('Next', on_click=self._go_next).props('flat')
+        row.set_visibility(False)
+        self._pagers.append((row, prev_btn, page_label, next_btn))
+
+    def _update_pagers(self, shown: int, total_count: int) -> None:
+        """Sync the persistent pagination widgets with the current page."""
+        if self._count_label:
+            self._count_label.text = (
+                f'Showing {shown} of {total_count} messages'
+            )
+        page = self._current_page
+        total_pages = self._total_pages
+        for row, prev_btn, page_label, next_btn in self._pagers:
+            row.set_visibility(total_pages > 1)
+            page_label.text = f'Page {page + 1} / {total_pages}'
+            prev_btn.set_enabled(page > 0)
+            next_btn.set_enabled(page < total_pages - 1)
+
+    def _go_prev(self) -> None:
+        if self._current_page > 0:
+            self._current_page -= 1
+            self._refresh_messages()
+
+    def _go_next(self) -> None:
+        if self._current_page < self._total_pages - 1:
+            self._current_page += 1
             self._refresh_messages()
     
     def _render_filters(self):
@@ -170,123 +254,212 @@ class ArchivePage:
 
         self._msg_outer.clear()
 
-        snapshot = self._shared.get_snapshot()
-
         with self._msg_outer:
-            self._render_messages(snapshot)
+            self._render_messages(self._get_archive())
+
+    def _get_archive(self) -> Optional[MessageArchive]:
+        """Return the message archive, memoized after the first lookup.
+
+        The archive instance is created once with SharedData and never
+        replaced, so there is no need to build a full snapshot (contacts,
+        messages, room caches …) on every refresh just to reach it.
+        """
+        if self._archive is None:
+            self._archive = self._shared.get_snapshot().get('archive')
+        return self._archive
 
-    def _render_messages(self, snapshot: dict):
+    def _render_messages(self, archive: Optional[MessageArchive]):
         """Render messages with pagination.
         
         Args:
-            snapshot: Current snapshot containing archive data.
+            archive: Message archive, or None when archiving is disabled.
         """
-        if not snapshot.get('archive'):
+        if not archive:
+            self._total_pages = 0
+            self._update_pagers(0, 0)
             ui.label('Archive not available').classes('text-gray-500 italic')
             return
         
-        archive = snapshot['archive']
-        
-        # Calculate date range
-        now = datetime.now(timezone.utc)
-        after = None if self._days_back >= 9999 else now - timedelta(days=self._days_back)
-        
-        # Handle DM filter separately (query_messages doesn't filter by channel=None)
-        is_dm_filter = (self._channel_name_filter == 'DM')
-        query_channel = None if is_dm_filter else self._channel_name_filter
-        
-        # Query messages
-        messages, total_count = archive.query_messages(
-            after=after,
-            channel_name=query_channel,
-            text_search=self._text_filter if self._text_filter else None,
-            limit=self._page_size if not is_dm_filter else self._page_size * 5,
-            offset=self._current_page * self._page_size if not is_dm_filter else 0,
-        )
-        
-        # Post-filter for DM (channel is None)
-        if is_dm_filter:
-            messages = [m for m in messages if m.get('channel') is None]
-            total_count = len(messages)
-            # Apply pagination manually
-            start = self._current_page * self._page_size
-            messages = messages[start:start + self._page_size]
-        
+        messages, total_count = self._fetch_page(archive, self._current_page)
+
         # Pagination info
-        total_pages = (total_count + self._page_size - 1) // self._page_size
-        
-        # Pagination header
-        with ui.row().classes('w-full items-center justify-between'):
-            ui.label(f'Showing {len(messages)} of {total_count} messages').classes('text-sm text-gray-600')
-            
-            if total_pages > 1:
-                with ui.row().classes('gap-2'):
-                    # Previous button
-                    def go_prev():
-                        if self._current_page > 0:
-                            self._current_page -= 1
-                            self._refresh_messages()
-                    
-                    ui.button('Previous', on_click=go_prev).props(
-                        f'flat {"disabled" if self._current_page == 0 else ""}'
-                    )
-                    
-                    # Page indicator
-                    ui.label(f'Page {self._current_page + 1} / {total_pages}').classes('mx-2')
-                    
-                    # Next button
-                    def go_next():
-                        if self._current_page < total_pages - 1:
-                            self._current_page += 1
-                            self._refresh_messages()
-                    
-                    ui.button('Next', on_click=go_next).props(
-                        f'flat {"disabled" if self._current_page >= total_pages - 1 else ""}'
-                    )
-        
+        self._total_pages = (total_count + self._page_size - 1) // self._page_size
+        self._update_pagers(len(messages), total_count)
+
+        # Format display lines in one pass right after the query, so
+        # the widget loop below does no per-row formatting work.
+        # Channel tag is hidden when viewing a specific channel/DM.
+        rows = self._format_rows(
+            messages, show_channel=self._channel_name_filter is None,
+        )
+
         # Messages list (single-line format, same as main page)
-        if not messages:
+        if not rows:
             ui.label('No messages found').classes('text-gray-500 italic mt-4')
         else:
+            # One delegated click handler on the list instead of a
+            # closure per row; rows carry their index in data-idx.
+            self._row_hashes = [msg_hash for _, msg_hash in rows]
             with ui.column().classes(
                     'w-full flex-grow overflow-y-auto gap-0 text-sm font-mono '
                     'bg-gray-50 p-2 rounded'
-                ):
-                    # Hide channel tag when viewing a specific channel/DM
-                    hide_ch = self._channel_name_filter is not None
-
-                    for msg_dict in messages:
-                        msg = Message.from_dict(msg_dict)
-                        line = msg.format_line(show_channel=not hide_ch)
-                        msg_hash = msg_dict.get('message_hash', '')
-                        
+                ).on('click', self._on_row_click, js_handler=_ROW_CLICK_JS):
+                    for i, (line, _) in enumerate(rows):
                         ui.label(line).classes(
                             'text-xs leading-tight cursor-pointer '
                             'hover:bg-blue-50 rounded px-1'
-                        ).on('click', lambda e, h=msg_hash: self._open_route(h))
-        
-        # Pagination footer
-        if total_pages > 1:
-            with ui.row().classes('w-full items-center justify-center mt-4'):
-                ui.button('Previous', on_click=go_prev).props(
-                    f'flat {"disabled" if self._current_page == 0 else ""}'
-                )
-                ui.label(f'Page {self._current_page + 1} / {total_pages}').classes('mx-4')
-                ui.button('Next', on_click=go_next).props(
-                    f'flat {"disabled" if self._current_page >= total_pages - 1 else ""}'
-                )
-    
+                        ).props(f'data-idx={i}')
+
+    # -- Query + page cache -------------------------------------------
+
+    def _filter_state(self) -> tuple:
+        """Snapshot of the current filters: ``(days_back, channel, text)``."""
+        return (self._days_back, self._channel_name_filter, self._text_filter)
+
+    def _query_page(
+        self, archive: MessageArchive, filters: tuple, page: int,
+    ) -> Tuple[list, int]:
+        """Run the archive query for a single page.
+
+        Args:
+            archive: Message archive to query.
+            filters: Filter state from :meth:`_filter_state`.
+            page:    Zero-based page number.
+
+        Returns:
+            Tuple of (message dicts for *page*, total matching count).
+        """
+        days_back, channel_filter, text_filter = filters
+
+        # Calculate date range
+        now = datetime.now(timezone.utc)
+        after = None if days_back >= 9999 else now - timedelta(days=days_back)
+
+        text_search = text_filter if text_filter else None
+        start = page * self._page_size
+
+        # DM filter: query_messages() cannot select channel=None, so
+        # stream matches and keep only this page; the remainder is
+        # counted without being materialized.
+        if channel_filter == 'DM':
+            matches = archive.iter_messages(
+                after=after, text_search=text_search, dm_only=True,
+            )
+            end = start + self._page_size
+            messages = []
+            total_count = 0
+            for total_count, msg in enumerate(matches, 1):
+                if start < total_count <= end:
+                    messages.append(msg)
+            return messages, total_count
+
+        # Query messages
+        messages, total_count = archive.query_messages(
+            after=after,
+            channel_name=channel_filter,
+            text_search=text_search,
+            limit=self._page_size,
+            offset=start,
+        )
+
+        return messages, total_count
+
+    def _fetch_page(self, archive: MessageArchive, page: int) -> Tuple[list, int]:
+        """Return *page* from the cache, querying the archive on a miss.
+
+        After a page is served, neighbouring pages missing from the
+        cache are prefetched in the background so linear Previous /
+        Next paging is instant.
+        """
+        filters = self._filter_state()
+        version = archive.messages_version
+        key = (version, filters, page)
+        with self._cache_lock:
+            result = self._page_cache.get(key)
+        if result is None:
+            result = self._query_page(archive, filters, page)
+            self._store_page(key, result)
+
+        total_pages = (result[1] + self._page_size - 1) // self._page_size
+        with self._prefetch_cond:
+            missing = [
+                p for p in (page + 1, page - 1)
+                if 0 <= p < total_pages
+                and (version, filters, p) not in self._page_cache
+            ]
+            if missing:
+                self._prefetch_job = (archive, version, filters, missing)
+                if self._prefetch_thread is None:
+                    self._prefetch_thread = threading.Thread(
+                        target=self._prefetch_loop, daemon=True,
+                    )
+                    self._prefetch_thread.start()
+                self._prefetch_cond.notify()
+        return result
+
+    def _prefetch_loop(self) -> None:
+        """Run prefetch jobs as they are requested (worker thread)."""
+        while True:
+            with self._prefetch_cond:
+                while self._prefetch_job is None:
+                    self._prefetch_cond.wait()
+                job, self._prefetch_job = self._prefetch_job, None
+            self._prefetch(*job)
+
+    def _prefetch(
+        self,
+        archive: MessageArchive,
+        version: int,
+        filters: tuple,
+        pages: List[int],
+    ) -> None:
+        """Populate the page cache for *pages* (runs off the UI thread).
+
+        Stops once the archive changed since the job was requested:
+        those pages would be keyed to a stale version and never hit.
+        """
+        for page in pages:
+            if archive.messages_version != version:
+                return
+            key = (version, filters, page)
+            with self._cache_lock:
+                if key in self._page_cache:
+                    continue
+            self._store_page(key, self._query_page(archive, filters, page))
+
+    def _store_page(self, key: tuple, result: Tuple[list, int]) -> None:
+        """Insert a page into the cache, evicting the oldest entries."""
+        with self._cache_lock:
+            self._page_cache[key] = result
+            while len(self._page_cache) > self._PAGE_CACHE_SIZE:
+                del self._page_cache[next(iter(self._page_cache))]
+
     @staticmethod
-    def setup_route(shared: SharedDataReadAndLookup):
-        """Setup the /archive route.
-        
+    def _format_rows(messages: list, show_channel: bool) -> List[Tuple[str, str]]:
+        """Precompute ``(display_line, message_hash)`` for a result page.
+
         Args:
-            shared: SharedData reader with contact lookup.
+            messages:     Archive message dicts for the current page.
+            show_channel: Include the ``[channel]`` / ``[DM]`` tag.
+
+        Returns:
+            List of display tuples in the same order as *messages*.
         """
-        @ui.page('/archive')
-        def archive_page():
-            page = ArchivePage(shared)
-            page.render()
+        return [
+            (
+                Message.from_dict(d).format_line(show_channel=show_channel),
+                d.get('message_hash', ''),
+            )
+            for d in messages
+        ]
+
+    def _on_row_click(self, e) -> None:
+        """Delegated click handler for the message list."""
+        try:
+            msg_hash = self._row_hashes[int(e.args)]
+        except (TypeError, ValueError, IndexError):
+            return
+        self._open_route(msg_hash)
 
     @staticmethod
     def _open_route(msg_hash: str) -> None:
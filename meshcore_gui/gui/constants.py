@@ -2,10 +2,34 @@
 Display constants for the GUI layer.
 
 Contact type → icon/name/label mappings used by multiple panels.
+Contact types are small dense ints (0=unknown, 1=CLI, 2=REP, 3=ROOM),
+so the tables are tuples indexed by type; use the ``*_for`` helpers,
+which fall back to the type-0 entry for unknown values.
 """
 
-from typing import Dict
+from typing import Tuple
 
-TYPE_ICONS: Dict[int, str] = {0: "○", 1: "📱", 2: "📡", 3: "🏠"}
-TYPE_NAMES: Dict[int, str] = {0: "-", 1: "CLI", 2: "REP", 3: "ROOM"}
-TYPE_LABELS: Dict[int, str] = {0: "-", 1: "Companion", 2: "Repeater", 3: "Room Server"}
+TYPE_ICONS: Tuple[str, ...] = ("○", "📱", "📡", "🏠")
+TYPE_NAMES: Tuple[str, ...] = ("-", "CLI", "REP", "ROOM")
+TYPE_LABELS: Tuple[str, ...] = ("-", "Companion", "Repeater", "Room Server")
+
+
+def icon_for(ctype: int) -> str:
+    """Return the icon for contact type *ctype* (``'○'`` if unknown)."""
+    if isinstance(ctype, int) and 0 <= ctype < len(TYPE_ICONS):
+        return TYPE_ICONS[ctype]
+    return TYPE_ICONS[0]
+
+
+def name_for(ctype: int) -> str:
+    """Return the short name for contact type *ctype* (``'-'`` if unknown)."""
+    if isinstance(ctype, int) and 0 <= ctype < len(TYPE_NAMES):
+        return TYPE_NAMES[ctype]
+    return TYPE_NAMES[0]
+
+
+def label_for(ctype: int) -> str:
+    """Return the long label for contact type *ctype* (``'-'`` if unknown)."""
+    if isinstance(ctype, int) and 0 <= ctype < len(TYPE_LABELS):
+        return TYPE_LABELS[ctype]
+    return TYPE_LABELS[0]
@@ -1,19 +1,28 @@
 """
 Main dashboard page for MeshCore GUI.
 
-Thin orchestrator that owns the layout and the 500 ms update timer.
+Thin orchestrator that owns the layout and the adaptive update timer
+(500 ms while data is changing, slower when idle or on the landing page).
 All visual content is delegated to individual panel classes in
 :mod:`meshcore_gui.gui.panels`.
 """
 
+import functools
 import logging
+import time
 from urllib.parse import urlencode
 
 from nicegui import ui
 
 from meshcore_gui import config
 
-from meshcore_gui.core.protocols import SharedDataReader
+from meshcore_gui.core.protocols import (
+    DIRTY_CHANNELS,
+    DIRTY_CONTACTS,
+    DIRTY_DEVICE,
+    DIRTY_RXLOG,
+    SharedDataReader,
+)
 from meshcore_gui.gui.panels import (
     ActionsPanel,
     ContactsPanel,
@@ -29,17 +38,28 @@ from meshcore_gui.services.room_password_store import RoomPasswordStore
 
 
 # Suppress the harmless "Client has been deleted" warning that NiceGUI
-# emits when a browser tab is refreshed while a ui.timer is active.
+# emits when a browser tab is refreshed while a ui.timer is active, and
+# the same error when it surfaces as the exception of a logged record.
+_CLIENT_DELETED = 'Client has been deleted'
+
+
 class _DeletedClientFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
-        return 'Client has been deleted' not in record.getMessage()
+        exc = record.exc_info[1] if record.exc_info else None
+        if exc is not None and _CLIENT_DELETED in str(exc):
+            return False
+        return _CLIENT_DELETED not in record.getMessage()
 
 logging.getLogger('nicegui').addFilter(_DeletedClientFilter())
 
+logger = logging.getLogger(__name__)
+logger.addFilter(_DeletedClientFilter())
+
 
 # ── DOMCA Theme ──────────────────────────────────────────────────────
-# Fonts + CSS variables adapted from domca.nl style.css for NiceGUI/Quasar.
-# Dark/light variable sets switch via Quasar's body--dark / body--light classes.
+# PWA meta tags, fonts and the DOMCA stylesheet.  The CSS itself lives in
+# static/domca.css so browsers fetch and cache it once instead of
+# receiving it inline with every page load.
 
 _DOMCA_HEAD = '''
 <link rel="manifest" href="/static/manifest.json">
@@ -50,192 +70,44 @@ _DOMCA_HEAD = '''
 <meta name="apple-mobile-web-app-title" content="DOMCA">
 <link rel="apple-touch-icon" href="/static/icon-192.png">
 <link href="https://fonts.googleapis.com/css2?family=Exo+2:wght@800&family=JetBrains+Mono:wght@400;700&display=swap" rel="stylesheet">
-<style>
-/* ── DOMCA theme variables (dark) ── */
-body.body--dark {
-  --bg: #0A1628;
-  --grid: #0077B6;   --grid-op: 0.15;
-  --mesh-bg: #48CAE4; --mesh-bg-op: 0.08;
-  --line: #0077B6;   --line-op: 0.6;
-  --wave: #48CAE4;   --node: #00B4D8; --node-center: #CAF0F8;
-  --hub-text: #0A1628; --outer: #0077B6;
-  --title: #48CAE4;  --subtitle: #48CAE4;
-  --tagline: #90E0EF; --tag-op: 0.5;
-  --badge-stroke: #0077B6; --badge-text: #48CAE4;
-  --callsign: #0077B6;
-}
-/* ── DOMCA theme variables (light) ── */
-body.body--light {
-  --bg: #FFFFFF;
-  --grid: #023E8A;   --grid-op: 0.04;
-  --mesh-bg: #0077B6; --mesh-bg-op: 0.05;
-  --line: #0096C7;   --line-op: 0.35;
-  --wave: #0096C7;   --node: #0077B6; --node-center: #FFFFFF;
-  --hub-text: #FFFFFF; --outer: #0096C7;
-  --title: #0077B6;  --subtitle: #0077B6;
-  --tagline: #0096C7; --tag-op: 0.4;
-  --badge-stroke: #0077B6; --badge-text: #0077B6;
-  --callsign: #0096C7;
-}
-
-/* ── DOMCA page background ── */
-body.body--dark  { background: #0A1628 !important; }
-body.body--light { background: #f4f8fb !important; }
-body.body--dark .q-page  { background: #0A1628 !important; }
-body.body--light .q-page { background: #f4f8fb !important; }
-
-/* ── DOMCA header ── */
-body.body--dark .q-header  { background: #0d1f35 !important; }
-body.body--light .q-header { background: #0077B6 !important; }
-
-/* ── DOMCA drawer — distinct from page background ── */
-body.body--dark .domca-drawer  { background: #0f2340 !important; border-right: 1px solid rgba(0,119,182,0.25) !important; }
-body.body--light .domca-drawer { background: rgba(244,248,251,0.97) !important; }
-.domca-drawer .q-btn__content  { justify-content: flex-start !important; }
-
-/* ── DOMCA cards — dark mode readable ── */
-body.body--dark .q-card {
-  background: #112240 !important;
-  color: #e0f0f8 !important;
-  border: 1px solid rgba(0,119,182,0.15) !important;
-}
-body.body--dark .q-card .text-gray-600 { color: #48CAE4 !important; }
-body.body--dark .q-card .text-gray-500 { color: #8badc4 !important; }
-body.body--dark .q-card .text-gray-400 { color: #6a8fa8 !important; }
-body.body--dark .q-card .text-xs       { color: #c0dce8 !important; }
-body.body--dark .q-card .text-sm       { color: #d0e8f2 !important; }
-body.body--dark .q-card .text-red-400  { color: #f87171 !important; }
-
-/* ── Dark mode: message area, inputs, tables ── */
-body.body--dark .bg-gray-50  { background: #0c1a2e !important; color: #c0dce8 !important; }
-body.body--dark .bg-gray-100 { background: #152a45 !important; }
-body.body--dark .hover\\:bg-gray-100:hover { background: #1a3352 !important; }
-body.body--dark .hover\\:bg-blue-50:hover  { background: #0d2a4a !important; }
-body.body--dark .bg-yellow-50 { background: rgba(72,202,228,0.06) !important; }
-
-body.body--dark .q-field__control { background: #0c1a2e !important; color: #e0f0f8 !important; }
-body.body--dark .q-field__native  { color: #e0f0f8 !important; }
-body.body--dark .q-field__label   { color: #8badc4 !important; }
-
-body.body--dark .q-table { background: #112240 !important; color: #c0dce8 !important; }
-body.body--dark .q-table thead th { color: #48CAE4 !important; }
-body.body--dark .q-table tbody td { color: #c0dce8 !important; }
-
-body.body--dark .q-checkbox__label { color: #c0dce8 !important; }
-body.body--dark .q-btn--flat:not(.domca-menu-btn):not(.domca-sub-btn) { color: #48CAE4 !important; }
-
-body.body--dark .q-separator { background: rgba(0,119,182,0.2) !important; }
-
-/* ── DOMCA menu link styling ── */
-body.body--dark .domca-menu-btn        { color: #8badc4 !important; }
-body.body--dark .domca-menu-btn:hover  { color: #48CAE4 !important; }
-body.body--light .domca-menu-btn       { color: #3d6380 !important; }
-body.body--light .domca-menu-btn:hover { color: #0077B6 !important; }
-
-body.body--dark .domca-ext-link  { color: #8badc4 !important; }
-body.body--light .domca-ext-link { color: #3d6380 !important; }
-
-/* ── DOMCA active menu item ── */
-body.body--dark .domca-menu-active  { color: #48CAE4 !important; background: rgba(72,202,228,0.1) !important; }
-body.body--light .domca-menu-active { color: #0077B6 !important; background: rgba(0,119,182,0.08) !important; }
-
-/* ── DOMCA submenu item styling ── */
-body.body--dark .domca-sub-btn        { color: #6a8fa8 !important; }
-body.body--dark .domca-sub-btn:hover  { color: #48CAE4 !important; }
-body.body--light .domca-sub-btn       { color: #5a7a90 !important; }
-body.body--light .domca-sub-btn:hover { color: #0077B6 !important; }
-
-/* ── DOMCA expansion panel in drawer ── */
-.domca-drawer .q-expansion-item {
-  font-family: 'JetBrains Mono', monospace !important;
-  letter-spacing: 2px;
-  font-size: 0.8rem;
-}
-.domca-drawer .q-expansion-item .q-item {
-  padding: 0.35rem 1.2rem !important;
-  min-height: 32px !important;
-}
-.domca-drawer .q-expansion-item .q-expansion-item__content {
-  padding: 0 !important;
-}
-.domca-drawer .q-expansion-item + .q-expansion-item {
-  margin-top: 0 !important;
-}
-body.body--dark .domca-drawer .q-expansion-item { color: #8badc4 !important; }
-body.body--dark .domca-drawer .q-expansion-item__container { background: transparent !important; }
-body.body--dark .domca-drawer .q-item { color: #8badc4 !important; }
-body.body--light .domca-drawer .q-expansion-item { color: #3d6380 !important; }
-body.body--light .domca-drawer .q-item { color: #3d6380 !important; }
-
-/* ── Landing page centering ── */
-.domca-landing {
-  display: flex;
-  align-items: center;
-  justify-content: center;
-  min-height: calc(100vh - 64px);
-  padding: 0.5rem;
-}
-.domca-landing svg {
-  width: min(90vw, 800px);
-  height: auto;
-  display: block;
-}
-
-/* ── Panel container — responsive single column ── */
-.domca-panel {
-  width: 100%;
-  max-width: 900px;
-  margin: 0 auto;
-  padding: 0.5rem;
-}
-
-/* ── Responsive heights — override fixed Tailwind heights in panels ── */
-.domca-panel .h-40  { height: calc(100vh - 20rem) !important; min-height: 10rem; }
-.domca-panel .h-32  { height: calc(100vh - 24rem) !important; min-height: 8rem; }
-.domca-panel .h-72  { height: calc(100vh - 12rem) !important; min-height: 14rem; }
-.domca-panel .max-h-48 { max-height: calc(100vh - 16rem) !important; min-height: 6rem; }
-
-/* ── Allow narrow viewports down to 320px ── */
-body, .q-layout, .q-page {
-  min-width: 0 !important;
-}
-.q-drawer { max-width: 80vw !important; width: 260px !important; min-width: 200px !important; }
-
-/* ── Mobile optimisations ── */
-@media (max-width: 640px) {
-  .domca-landing svg { width: 98vw; }
-  .domca-panel       { padding: 0.25rem; }
-  .domca-panel .q-card { border-radius: 8px !important; }
-}
-@media (max-width: 400px) {
-  .domca-landing { padding: 0.25rem; }
-  .domca-landing svg { width: 100vw; }
-  .q-header { padding-left: 0.5rem !important; padding-right: 0.5rem !important; }
-}
-
-/* ── Footer label ── */
-.domca-footer {
-  font-family: 'JetBrains Mono', monospace;
-  font-size: 0.65rem;
-  letter-spacing: 2px;
-  opacity: 0.3;
-}
-
-/* ── Header text: icon-only on narrow viewports ── */
-@media (max-width: 599px) {
-  .domca-header-text { display: none !important; }
-}
-</style>
+<script>
+// Panel switches push /?panel=... without reloading; reload on back/forward
+// so the dashboard restores the panel from the URL query params.
+window.addEventListener('popstate', () => window.location.reload());
+// Report tab visibility so the dashboard can slow its update timer.
+document.addEventListener('visibilitychange',
+    () => emitEvent('domca_visibility', document.hidden));
+// Contact rows: one delegated listener reports pin and DM clicks by
+// the row's data-key (handled by ContactsPanel).
+document.addEventListener('click', (e) => {
+    const row = e.target.closest('.domca-contact-row[data-key]');
+    if (!row) return;
+    if (e.target.closest('.q-checkbox')) {
+        emitEvent('domca_contact_pin', row.dataset.key);
+    } else if (e.target.closest('.domca-contact-main')) {
+        emitEvent('domca_contact_click', row.dataset.key);
+    }
+});
+// Message lines: one delegated listener reports clicks by the line's
+// data-route, a message hash or list index (handled by MessagesPanel).
+document.addEventListener('click', (e) => {
+    const line = e.target.closest('.domca-msg-line[data-route]');
+    if (line) emitEvent('domca_msg_click', line.dataset.route);
+});
+</script>
+<link rel="stylesheet" href="/static/domca.css">
 '''
 
 # ── Landing SVG loader ────────────────────────────────────────────────
 # Reads the SVG from config.LANDING_SVG_PATH and replaces {callsign}
 # with config.OPERATOR_CALLSIGN.  Falls back to a minimal placeholder
-# when the file is missing.
+# when the file is missing.  Both settings are fixed per process, so
+# the result is cached after the first render.
 
 
+@functools.lru_cache(maxsize=1)
 def _load_landing_svg() -> str:
-    """Load the landing page SVG from disk.
+    """Load the landing page SVG from disk (cached after first call).
 
     Returns:
         SVG markup string with ``{callsign}`` replaced by the
@@ -265,8 +137,59 @@ _STANDALONE_ITEMS = [
     ('\U0001f4ca', 'RX LOG',   'rxlog'),
 ]
 
+# Button text per standalone item, formatted once at import time
+_STANDALONE_BUTTONS = [
+    (f'{icon}  {label}', panel_id)
+    for icon, label, panel_id in _STANDALONE_ITEMS
+]
+
 _EXT_LINKS = config.EXT_LINKS
 
+# ── Update timer cadence ─────────────────────────────────────────────
+# The timer runs at _UPDATE_INTERVAL while data is changing and backs
+# off to _IDLE_UPDATE_INTERVAL on the landing page, while the browser
+# tab is hidden, or after _IDLE_TICKS consecutive ticks without any
+# change.  The interval is never shorter than twice the measured cost
+# of the previous tick, so a slow refresh cannot queue up behind itself.
+
+_UPDATE_INTERVAL = 0.5
+_IDLE_UPDATE_INTERVAL = 2.0
+_IDLE_TICKS = 4
+
+# ── Dirty mask and update coalescing ─────────────────────────────────
+# Every tick sets one bit per changed subsystem (see _dirty_mask).  The
+# four update flags arrive pre-packed in the snapshot's dirty_flags
+# field (DIRTY_* bits from protocols); messages, rooms and the BOT
+# toggle have no flag and are detected by comparing their snapshot
+# version with the previous tick.  Panels that are refreshed every
+# tick are skipped when none of the bits they depend on is set.
+#
+# Bits are OR-ed into a pending mask and panels are refreshed at most
+# once per _COALESCE_WINDOW.  Several timers can call _update_ui within
+# a few ms (one per open browser tab, since the DashboardPage instance
+# is shared); their changes are merged instead of each triggering its
+# own rebuild.
+
+_DEVICE_DIRTY = DIRTY_DEVICE
+_CONTACTS_DIRTY = DIRTY_CONTACTS
+_CHANNELS_DIRTY = DIRTY_CHANNELS
+_RXLOG_DIRTY = DIRTY_RXLOG
+_MESSAGES_DIRTY = 1 << 4
+_ROOMS_DIRTY = 1 << 5
+_BOT_DIRTY = 1 << 6
+
+_UPDATE_FLAGS = (
+    ('device_updated', _DEVICE_DIRTY),
+    ('contacts_updated', _CONTACTS_DIRTY),
+    ('channels_updated', _CHANNELS_DIRTY),
+    ('rxlog_updated', _RXLOG_DIRTY),
+)
+
+_MESSAGES_DEPS = _MESSAGES_DIRTY | _CHANNELS_DIRTY | _ROOMS_DIRTY
+_ROOM_SERVER_DEPS = _MESSAGES_DIRTY | _ROOMS_DIRTY
+
+_COALESCE_WINDOW = 0.1
+
 # ── Shared button styles ─────────────────────────────────────────────
 
 _SUB_BTN_STYLE = (
@@ -281,6 +204,21 @@ _MENU_BTN_STYLE = (
     "padding: 0.35rem 1.2rem"
 )
 
+_BRAND_BTN_STYLE = (
+    "font-family: 'Exo 2', sans-serif; font-size: 1.4rem; "
+    "font-weight: 800; color: var(--title); letter-spacing: 4px; "
+    "margin-bottom: 0.3rem; padding: 0"
+)
+
+_EXT_LINK_STYLE = (
+    "font-family: 'JetBrains Mono', monospace; "
+    "letter-spacing: 2px; font-size: 0.72rem; "
+    "text-decoration: none; opacity: 0.6; "
+    "display: block; padding: 0.35rem 0"
+)
+
+_EXPANSION_PROPS = 'dense header-class="q-pa-none"'
+
 
 class DashboardPage:
     """Main dashboard rendered at ``/``.
@@ -302,6 +240,7 @@ class DashboardPage:
         self._actions: ActionsPanel | None = None
         self._rxlog: RxLogPanel | None = None
         self._room_server: RoomServerPanel | None = None
+        self._dispatch: tuple = ()
 
         # Header status label
         self._status_label = None
@@ -311,20 +250,59 @@ class DashboardPage:
 
         # Panel switching state (layout)
         self._panel_containers: dict = {}
+        self._lazy_panels: dict = {}
         self._active_panel: str = 'landing'
         self._drawer = None
-        self._menu_buttons: dict = {}
 
         # Submenu containers (for dynamic channel/room items)
         self._msg_sub_container = None
         self._archive_sub_container = None
         self._rooms_sub_container = None
+        self._msg_sub_btns: dict = {}
+        self._archive_sub_btns: dict = {}
+        self._rooms_sub_btns: dict = {}
         self._last_channel_fingerprint = None
         self._last_rooms_fingerprint = None
+        self._last_rooms_version = None
 
         # Archive page reference (for inline channel switching)
         self._archive_page: ArchivePage | None = None
 
+        # Shared click handler for the ROOMS submenu: every room item
+        # opens the same panel (all room cards live in one container),
+        # so one callable replaces a closure per item.
+        self._open_rooms = functools.partial(self._navigate_panel, 'rooms')
+
+        # Static drawer click handlers, built once and reused by every
+        # render() (one per browser connection)
+        nav = functools.partial
+        self._open_landing = nav(self._navigate_panel, 'landing')
+        self._open_messages_all = nav(self._navigate_panel, 'messages', None)
+        self._open_messages_dm = nav(self._navigate_panel, 'messages', 'DM')
+        self._open_archive_all = nav(self._navigate_panel, 'archive', None)
+        self._open_archive_dm = nav(self._navigate_panel, 'archive', 'DM')
+        self._open_standalone = {
+            panel_id: nav(self._navigate_panel, panel_id)
+            for _, panel_id in _STANDALONE_BUTTONS
+        }
+
+        # Adaptive update timer state
+        self._timer = None
+        self._idle_ticks: int = 0
+        self._last_cost: float = 0.0
+        self._tab_hidden: bool = False
+        self._last_msg_marker = None
+        self._last_rooms_marker = None
+        self._last_bot_version = None
+
+        # Update flags accumulated across ticks (see _update_ui)
+        self._pending_dirty: int = 0
+        # Map flags deferred while the map panel is hidden
+        self._map_pending: set = set()
+        # MapPanel.has_markers as of its last update (read every tick)
+        self._map_has_markers: bool = False
+        self._last_flush: float = 0.0
+
     # ------------------------------------------------------------------
     # Public
     # ------------------------------------------------------------------
@@ -338,17 +316,33 @@ class DashboardPage:
         # when the channel/room data hasn't changed since last session.
         self._last_channel_fingerprint = None
         self._last_rooms_fingerprint = None
+        self._last_rooms_version = None
+        self._msg_sub_btns = {}
+        self._archive_sub_btns = {}
+        self._rooms_sub_btns = {}
 
         # Create panel instances (UNCHANGED functional wiring)
         put_cmd = self._shared.put_command
         self._device = DevicePanel()
         self._contacts = ContactsPanel(put_cmd, self._pin_store, self._shared.set_auto_add_enabled, self._on_add_room_server)
         self._map = MapPanel()
+        self._map_has_markers = False
         self._messages = MessagesPanel(put_cmd)
         self._actions = ActionsPanel(put_cmd, self._shared.set_bot_enabled)
         self._rxlog = RxLogPanel()
         self._room_server = RoomServerPanel(put_cmd, self._room_password_store)
 
+        # Panel refreshes gated only on dirty bits, run in this order by
+        # _update_ui: (bits the panel depends on, refresh callable)
+        self._dispatch = (
+            (_DEVICE_DIRTY, self._device.update),
+            (_BOT_DIRTY, self._actions.update),
+            (_CONTACTS_DIRTY, self._contacts.update),
+            (_MESSAGES_DEPS, self._refresh_messages),
+            (_ROOM_SERVER_DEPS, self._room_server.update),
+            (_RXLOG_DIRTY, self._rxlog.update),
+        )
+
         # Inject DOMCA theme (fonts + CSS variables)
         ui.add_head_html(_DOMCA_HEAD)
 
@@ -366,72 +360,51 @@ class DashboardPage:
             # DOMCA branding (clickable → landing page)
             with ui.column().style('padding: 0.2rem 1.2rem 0'):
                 ui.button(
-                    'DOMCA',
-                    on_click=lambda: self._navigate_panel('landing'),
-                ).props('flat no-caps').style(
-                    "font-family: 'Exo 2', sans-serif; font-size: 1.4rem; "
-                    "font-weight: 800; color: var(--title); letter-spacing: 4px; "
-                    "margin-bottom: 0.3rem; padding: 0"
-                )
-
-            self._menu_buttons = {}
+                    'DOMCA', on_click=self._open_landing,
+                ).props('flat no-caps').style(_BRAND_BTN_STYLE)
 
             # ── 💬 MESSAGES (expandable with channel submenu) ──────
             with ui.expansion(
                 '\U0001f4ac  MESSAGES', icon=None, value=False,
-            ).props('dense header-class="q-pa-none"').classes('w-full'):
+            ).props(_EXPANSION_PROPS).classes('w-full'):
                 self._msg_sub_container = ui.column().classes('w-full gap-0')
                 with self._msg_sub_container:
-                    self._make_sub_btn(
-                        'ALL', lambda: self._navigate_panel('messages', channel=None)
-                    )
-                    self._make_sub_btn(
-                        'DM', lambda: self._navigate_panel('messages', channel='DM')
-                    )
+                    self._make_sub_btn('ALL', self._open_messages_all)
+                    self._make_sub_btn('DM', self._open_messages_dm)
                     # Dynamic channel items populated by _update_submenus
 
             # ── 🏠 ROOMS (expandable with room submenu) ───────────
             with ui.expansion(
                 '\U0001f3e0  ROOMS', icon=None, value=False,
-            ).props('dense header-class="q-pa-none"').classes('w-full'):
+            ).props(_EXPANSION_PROPS).classes('w-full'):
                 self._rooms_sub_container = ui.column().classes('w-full gap-0')
                 with self._rooms_sub_container:
-                    self._make_sub_btn(
-                        'ALL', lambda: self._navigate_panel('rooms')
-                    )
-                    # Pre-populate from persisted rooms
-                    for entry in self._room_password_store.get_rooms():
-                        short = entry.name or entry.pubkey[:12]
-                        self._make_sub_btn(
-                            f'\U0001f3e0 {short}',
-                            lambda: self._navigate_panel('rooms'),
-                        )
+                    self._make_sub_btn('ALL', self._open_rooms)
+                    # Room items populated by _update_submenus
 
             # ── 📚 ARCHIVE (expandable with channel submenu) ──────
             with ui.expansion(
                 '\U0001f4da  ARCHIVE', icon=None, value=False,
-            ).props('dense header-class="q-pa-none"').classes('w-full'):
+            ).props(_EXPANSION_PROPS).classes('w-full'):
                 self._archive_sub_container = ui.column().classes('w-full gap-0')
                 with self._archive_sub_container:
-                    self._make_sub_btn(
-                        'ALL', lambda: self._navigate_panel('archive', channel=None)
-                    )
-                    self._make_sub_btn(
-                        'DM', lambda: self._navigate_panel('archive', channel='DM')
-                    )
+                    self._make_sub_btn('ALL', self._open_archive_all)
+                    self._make_sub_btn('DM', self._open_archive_dm)
                     # Dynamic channel items populated by _update_submenus
 
             ui.separator().classes('my-1')
 
             # ── Standalone menu items (MAP, DEVICE, ACTIONS, RX LOG)
-            for icon, label, panel_id in _STANDALONE_ITEMS:
-                btn = ui.button(
-                    f'{icon}  {label}',
-                    on_click=lambda pid=panel_id: self._navigate_panel(pid),
-                ).props('flat no-caps align=left').classes(
+            # The active highlight is pure CSS: it matches the button's
+            # data-panel against the drawer's data-active-panel.
+            for text, panel_id in _STANDALONE_BUTTONS:
+                ui.button(
+                    text, on_click=self._open_standalone[panel_id],
+                ).props(
+                    f'flat no-caps align=left data-panel={panel_id}'
+                ).classes(
                     'w-full justify-start domca-menu-btn'
                 ).style(_MENU_BTN_STYLE)
-                self._menu_buttons[panel_id] = btn
 
             ui.separator().classes('my-2')
 
@@ -440,12 +413,7 @@ class DashboardPage:
                 for label, url in _EXT_LINKS:
                     ui.link(label, url, new_tab=True).classes(
                         'domca-ext-link'
-                    ).style(
-                        "font-family: 'JetBrains Mono', monospace; "
-                        "letter-spacing: 2px; font-size: 0.72rem; "
-                        "text-decoration: none; opacity: 0.6; "
-                        "display: block; padding: 0.35rem 0"
-                    )
+                    ).style(_EXT_LINK_STYLE)
 
             # Footer in drawer
             ui.space()
@@ -487,37 +455,41 @@ class DashboardPage:
             ui.html(_load_landing_svg())
         self._panel_containers['landing'] = landing
 
-        # Panel containers (hidden by default, shown on menu click)
-        panel_defs = [
-            ('messages', self._messages),
-            ('contacts', self._contacts),
-            ('map',      self._map),
-            ('device',   self._device),
-            ('actions',  self._actions),
-            ('rxlog',    self._rxlog),
-            ('rooms',    self._room_server),
-        ]
-
-        for panel_id, panel_obj in panel_defs:
+        # Archive panel (inline — replaces separate /archive page)
+        self._archive_page = ArchivePage(self._shared)
+
+        # Panel containers (hidden by default, shown on menu click).
+        # Panel content is rendered lazily on first show (see
+        # _ensure_rendered); until then each panel's update() is a
+        # no-op.  The rooms panel is rendered eagerly because its cards
+        # define the room pubkeys that the messages view filters out
+        # and the target for rooms added from the contacts panel.
+        self._lazy_panels = {
+            'messages': self._messages.render,
+            'contacts': self._contacts.render,
+            'map':      self._map.render,
+            'device':   self._device.render,
+            'actions':  self._actions.render,
+            'rxlog':    self._rxlog.render,
+            'archive':  self._archive_page.render,
+        }
+
+        for panel_id in (*self._lazy_panels, 'rooms'):
             container = ui.column().classes('domca-panel')
             container.set_visibility(False)
-            with container:
-                panel_obj.render()
             self._panel_containers[panel_id] = container
 
-        # Archive panel (inline — replaces separate /archive page)
-        archive_container = ui.column().classes('domca-panel')
-        archive_container.set_visibility(False)
-        with archive_container:
-            self._archive_page = ArchivePage(self._shared)
-            self._archive_page.render()
-        self._panel_containers['archive'] = archive_container
+        with self._panel_containers['rooms']:
+            self._room_server.render()
 
         self._active_panel = 'landing'
 
         # Start update timer
+        self._idle_ticks = 0
+        self._tab_hidden = False
+        self._timer = ui.timer(_UPDATE_INTERVAL, self._tick)
+        ui.on('domca_visibility', self._on_visibility)
         self._apply_url_state()
-        ui.timer(0.5, self._update_ui)
 
     # ------------------------------------------------------------------
     # Submenu button helper (layout only)
@@ -538,73 +510,114 @@ class DashboardPage:
     # ------------------------------------------------------------------
 
     def _update_submenus(self, data: dict) -> None:
-        """Rebuild channel/room submenu items when data changes.
-
-        Only the dynamic items are rebuilt; the container is cleared and
-        ALL items (static + dynamic) are re-rendered.
+        """Sync channel/room submenu items with the current data.
+
+        The static items (ALL, DM) are created once in :meth:`render`;
+        the dynamic items are diffed against the existing buttons so
+        only added, removed or renamed entries touch the DOM.  Change
+        detection uses a rolling integer hash of ``(idx, name)`` /
+        ``(pubkey, name)`` so the unchanged path is a single int
+        comparison.
         """
         # ── Channel submenus (Messages + Archive) ──
         channels = data.get('channels', [])
-        ch_fingerprint = tuple((ch['idx'], ch['name']) for ch in channels)
+        ch_fingerprint = 0
+        for ch in channels:
+            ch_fingerprint = hash((ch_fingerprint, ch['idx'], ch['name']))
 
         if ch_fingerprint != self._last_channel_fingerprint and channels:
             self._last_channel_fingerprint = ch_fingerprint
 
-            # Rebuild Messages submenu
-            if self._msg_sub_container:
-                self._msg_sub_container.clear()
-                with self._msg_sub_container:
-                    self._make_sub_btn(
-                        'ALL', lambda: self._navigate_panel('messages', channel=None)
-                    )
-                    self._make_sub_btn(
-                        'DM', lambda: self._navigate_panel('messages', channel='DM')
-                    )
-                    for ch in channels:
-                        idx = ch['idx']
-                        name = ch['name']
-                        self._make_sub_btn(
-                            f"[{idx}] {name}",
-                            lambda i=idx: self._navigate_panel('messages', channel=i),
-                        )
-
-            # Rebuild Archive submenu
-            if self._archive_sub_container:
-                self._archive_sub_container.clear()
-                with self._archive_sub_container:
-                    self._make_sub_btn(
-                        'ALL', lambda: self._navigate_panel('archive', channel=None)
+            # Messages submenu (keyed by channel index)
+            self._sync_sub_btns(
+                self._msg_sub_container,
+                self._msg_sub_btns,
+                [
+                    (
+                        ch['idx'],
+                        f"[{ch['idx']}] {ch['name']}",
+                        lambda i=ch['idx']: self._navigate_panel('messages', channel=i),
                     )
-                    self._make_sub_btn(
-                        'DM', lambda: self._navigate_panel('archive', channel='DM')
+                    for ch in channels
+                ],
+                offset=2,
+            )
+
+            # Archive submenu (keyed by index + name: the click
+            # handler filters on the channel name)
+            self._sync_sub_btns(
+                self._archive_sub_container,
+                self._archive_sub_btns,
+                [
+                    (
+                        (ch['idx'], ch['name']),
+                        f"[{ch['idx']}] {ch['name']}",
+                        lambda n=ch['name']: self._navigate_panel('archive', channel=n),
                     )
-                    for ch in channels:
-                        idx = ch['idx']
-                        name = ch['name']
-                        self._make_sub_btn(
-                            f"[{idx}] {name}",
-                            lambda n=name: self._navigate_panel('archive', channel=n),
-                        )
+                    for ch in channels
+                ],
+                offset=2,
+            )
 
         # ── Room submenus ──
+        self._last_rooms_version = self._room_password_store.version
         rooms = self._room_password_store.get_rooms()
-        rooms_fingerprint = tuple((r.pubkey, r.name) for r in rooms)
+        rooms_fingerprint = 0
+        for r in rooms:
+            rooms_fingerprint = hash((rooms_fingerprint, r.pubkey, r.name))
 
         if rooms_fingerprint != self._last_rooms_fingerprint:
             self._last_rooms_fingerprint = rooms_fingerprint
 
-            if self._rooms_sub_container:
-                self._rooms_sub_container.clear()
-                with self._rooms_sub_container:
-                    self._make_sub_btn(
-                        'ALL', lambda: self._navigate_panel('rooms')
+            self._sync_sub_btns(
+                self._rooms_sub_container,
+                self._rooms_sub_btns,
+                [
+                    (
+                        entry.pubkey,
+                        f'\U0001f3e0 {entry.name or entry.pubkey[:12]}',
+                        self._open_rooms,
                     )
-                    for entry in rooms:
-                        short = entry.name or entry.pubkey[:12]
-                        self._make_sub_btn(
-                            f'\U0001f3e0 {short}',
-                            lambda: self._navigate_panel('rooms'),
-                        )
+                    for entry in rooms
+                ],
+                offset=1,
+            )
+
+    def _sync_sub_btns(
+        self,
+        container,
+        buttons: dict,
+        items: list,
+        offset: int,
+    ) -> None:
+        """Diff the dynamic buttons of one submenu against *items*.
+
+        Args:
+            container: Submenu column holding the buttons.
+            buttons:   ``{key: ui.button}`` of the dynamic items; updated
+                       in place.
+            items:     Desired ``(key, label, on_click)`` entries in order.
+            offset:    Number of static buttons preceding the dynamic ones.
+        """
+        if container is None:
+            return
+
+        wanted = {key for key, _, _ in items}
+        for key in [k for k in buttons if k not in wanted]:
+            container.remove(buttons.pop(key))
+
+        for pos, (key, label, on_click) in enumerate(items):
+            btn = buttons.get(key)
+            if btn is None:
+                with container:
+                    btn = self._make_sub_btn(label, on_click)
+                buttons[key] = btn
+            elif btn.text != label:
+                btn.text = label
+
+            # Keep menu order in sync with the channel/room order
+            if container.default_slot.children.index(btn) != offset + pos:
+                btn.move(target_index=offset + pos)
 
     # ------------------------------------------------------------------
     # Panel switching (layout helper — no functional logic)
@@ -648,22 +661,82 @@ class DashboardPage:
         return '/?' + urlencode(params)
 
     def _navigate_panel(self, panel_id: str, channel=None) -> None:
-        """Navigate with panel id in the URL so browser back restores state."""
-        ui.navigate.to(self._build_panel_url(panel_id, channel))
+        """Switch panel in place and record it in the browser history.
+
+        The panel (and any channel filter, e.g. an archive submenu
+        selection) is applied directly via :meth:`_show_panel` instead
+        of a full page navigation, so no widgets are re-rendered.  The
+        URL is pushed with ``history.pushState``; the ``popstate``
+        handler in ``_DOMCA_HEAD`` reloads on browser back, which then
+        restores the panel via :meth:`_apply_url_state`.
+        """
+        self._show_panel(panel_id, channel)
+        url = self._build_panel_url(panel_id, channel)
+        ui.run_javascript(f'history.pushState(null, "", {url!r})')
 
     def _show_panel(self, panel_id: str, channel=None) -> None:
         """Show the selected panel, hide all others, close the drawer.
 
+        The visible switch (containers, menu highlight, drawer) is sent
+        first; rendering and populating the panel is deferred to a
+        one-shot timer (see :meth:`_apply_panel_side_effects`) so the
+        switch reaches the browser without waiting for that work.
+
         Args:
             panel_id: Panel to show (e.g. 'messages', 'archive', 'rooms').
             channel:  Optional channel filter.
                       For messages: None=all, 'DM'=DM only, int=channel idx.
                       For archive:  None=all, 'DM'=DM only, str=channel name.
         """
-        for pid, container in self._panel_containers.items():
-            container.set_visibility(pid == panel_id)
+        # Only the outgoing and incoming panel change visibility; the
+        # channel filter still applies when re-selecting a panel
+        previous = self._active_panel
+        new = self._panel_containers.get(panel_id)
+        if panel_id != previous:
+            old = self._panel_containers.get(previous)
+            if old:
+                old.set_visibility(False)
+            if new:
+                new.set_visibility(True)
+
+            # Active menu highlight (standalone buttons only, see CSS):
+            # one attribute update on the drawer
+            if self._drawer:
+                self._drawer.props(f'data-active-panel={panel_id}')
         self._active_panel = panel_id
 
+        # Close drawer after selection
+        if self._drawer:
+            self._drawer.hide()
+
+        # User interaction: restore the fast update cadence right away
+        self._idle_ticks = 0
+        self._set_timer_interval(
+            _IDLE_UPDATE_INTERVAL if panel_id == 'landing' else _UPDATE_INTERVAL
+        )
+
+        if new is None:
+            return
+        with new:
+            ui.timer(
+                0,
+                functools.partial(
+                    self._apply_panel_side_effects, panel_id, channel,
+                ),
+                once=True,
+            )
+
+    def _apply_panel_side_effects(self, panel_id: str, channel) -> None:
+        """Render and populate a panel after :meth:`_show_panel`.
+
+        Skipped when another panel was selected in the meantime; that
+        panel's own call takes over (pending map flags stay parked).
+        """
+        if panel_id != self._active_panel:
+            return
+
+        self._ensure_rendered(panel_id)
+
         # Apply channel filter to messages panel
         if panel_id == 'messages' and self._messages:
             self._messages.set_active_channel(channel)
@@ -671,37 +744,61 @@ class DashboardPage:
             # moment it becomes visible, instead of waiting for the
             # next 500 ms timer tick (which caused the "empty on first
             # click, populated on second click" symptom).
-            data = self._shared.get_snapshot()
-            self._messages.update(
-                data,
-                self._messages.channel_filters,
-                self._messages.last_channels,
-                room_pubkeys=(
-                    self._room_server.get_room_pubkeys()
-                    if self._room_server else None
-                ),
-            )
+            self._refresh_messages(self._shared.get_snapshot())
 
         # Apply channel filter to archive panel
         if panel_id == 'archive' and self._archive_page:
             self._archive_page.set_channel_filter(channel)
 
-        # Force map recenter when opening map panel (Leaflet may be hidden on load)
+        # Force map recenter when opening map panel (Leaflet may be hidden
+        # on load) and apply any device/contact changes missed while hidden
         if panel_id == 'map' and self._map:
             data = self._shared.get_snapshot()
             data['force_center'] = True
+            for flag in self._map_pending:
+                data[flag] = True
+            self._map_pending.clear()
             self._map.update(data)
+            self._map_has_markers = self._map.has_markers
+
+    def _refresh_messages(self, data: dict) -> None:
+        """Refresh the messages panel with its current filters."""
+        self._messages.update(
+            data,
+            self._messages.channel_filters,
+            self._messages.last_channels,
+            room_pubkeys=(
+                self._room_server.get_room_pubkeys()
+                if self._room_server else None
+            ),
+        )
 
-        # Update active menu highlight (standalone buttons only)
-        for pid, btn in self._menu_buttons.items():
-            if pid == panel_id:
-                btn.classes('domca-menu-active', remove='')
-            else:
-                btn.classes(remove='domca-menu-active')
+    def _ensure_rendered(self, panel_id: str) -> None:
+        """Render a lazily created panel into its container on first show.
 
-        # Close drawer after selection
-        if self._drawer:
-            self._drawer.hide()
+        Update flags consumed while the panel was not rendered are not
+        replayed, so the panel is populated from a fresh snapshot right
+        after rendering.  The messages list and the map are populated by
+        :meth:`_apply_panel_side_effects` itself.
+        """
+        render = self._lazy_panels.pop(panel_id, None)
+        if render is None:
+            return
+
+        with self._panel_containers[panel_id]:
+            render()
+
+        data = self._shared.get_snapshot()
+        if panel_id == 'messages':
+            self._messages.update_channel_options(data['channels'])
+        elif panel_id == 'contacts':
+            self._contacts.update(data)
+        elif panel_id == 'device':
+            self._device.update(data)
+        elif panel_id == 'actions':
+            self._actions.update(data)
+        elif panel_id == 'rxlog':
+            self._rxlog.update(data)
 
     # ------------------------------------------------------------------
     # Room Server callback (from ContactsPanel)
@@ -720,16 +817,121 @@ class DashboardPage:
     # Timer-driven UI update
     # ------------------------------------------------------------------
 
+    def _set_timer_interval(self, interval: float) -> None:
+        """Change the update timer interval (takes effect next tick).
+
+        The requested interval is raised to the idle interval while the
+        tab is hidden, and to twice the cost of the last tick.
+        """
+        if self._tab_hidden:
+            interval = max(interval, _IDLE_UPDATE_INTERVAL)
+        interval = max(interval, 2 * self._last_cost)
+        if self._timer is not None and self._timer.interval != interval:
+            self._timer.interval = interval
+
+    def _tick(self) -> None:
+        """Timer callback: run :meth:`_update_ui` and record its cost."""
+        started = time.perf_counter()
+        self._update_ui()
+        self._last_cost = time.perf_counter() - started
+
+    def _on_visibility(self, e) -> None:
+        """Track browser tab visibility (``domca_visibility`` event)."""
+        self._tab_hidden = bool(e.args)
+        self._set_timer_interval(
+            _IDLE_UPDATE_INTERVAL if self._tab_hidden else _UPDATE_INTERVAL
+        )
+
+    def _dirty_mask(self, data: dict) -> int:
+        """Return the dirty bits for this tick's snapshot.
+
+        Messages have no update flag, so the section version from the
+        snapshot is compared.  Rooms change through the room card set
+        and the rooms version (login states and per-room message cache);
+        the BOT toggle through the bot version.
+        """
+        mask = data['dirty_flags']
+
+        msg_marker = data['messages_version']
+        if msg_marker != self._last_msg_marker:
+            self._last_msg_marker = msg_marker
+            mask |= _MESSAGES_DIRTY
+
+        rooms_marker = (
+            self._room_server.get_room_pubkeys(),
+            data['rooms_version'],
+        )
+        if rooms_marker != self._last_rooms_marker:
+            self._last_rooms_marker = rooms_marker
+            mask |= _ROOMS_DIRTY
+
+        if data['bot_version'] != self._last_bot_version:
+            self._last_bot_version = data['bot_version']
+            mask |= _BOT_DIRTY
+
+        return mask
+
+    def _adapt_timer(self, mask: int) -> None:
+        """Slow the update timer down while nothing is changing.
+
+        Any dirty bit for this tick counts as activity.
+        """
+        self._idle_ticks = 0 if mask else self._idle_ticks + 1
+
+        idle = self._active_panel == 'landing' or self._idle_ticks >= _IDLE_TICKS
+        self._set_timer_interval(
+            _IDLE_UPDATE_INTERVAL if idle else _UPDATE_INTERVAL
+        )
+
+    def _client_gone(self) -> bool:
+        """True when the tab that owns the timer was closed or refreshed.
+
+        Checked up front so a stale timer returns after a few attribute
+        reads instead of failing inside a panel update.
+        """
+        label = self._status_label
+        if label is None or getattr(label, 'is_deleted', False):
+            return True
+        client = getattr(label, 'client', None)
+        return (
+            client is None
+            or getattr(client, 'has_socket_connection', True) is False
+        )
+
     def _update_ui(self) -> None:
-        try:
-            if not self._status_label:
-                return
+        if self._client_gone():
+            return
 
+        try:
             # Atomic snapshot + flag clear: eliminates race condition
             # where worker sets channels_updated between separate
             # get_snapshot() and clear_update_flags() calls.
             data = self._shared.get_snapshot_and_clear_flags()
             is_first = not self._initialized
+            mask = self._dirty_mask(data)
+            self._adapt_timer(mask)
+
+            # Coalesce: merge this tick's bits into the pending mask and
+            # refresh at most once per window.  Pending bits survive a
+            # skipped tick, so no change is lost.
+            self._pending_dirty |= mask
+            now = time.monotonic()
+            if not is_first and now - self._last_flush < _COALESCE_WINDOW:
+                return
+            self._last_flush = now
+            mask = self._pending_dirty
+            self._pending_dirty = 0
+            for flag, bit in _UPDATE_FLAGS:
+                data[flag] = bool(mask & bit)
+
+            # Hot keys, looked up once per tick and unpacked in one go.
+            # The dict itself is still passed on to the panels.
+            device_updated, contacts_updated, channels_updated = (
+                data['device_updated'], data['contacts_updated'],
+                data['channels_updated'],
+            )
+            channels = data['channels']
+            contacts = data['contacts']
 
             # Mark initialised immediately — even if a panel update
             # crashes below, we must NOT retry the full first-render
@@ -737,65 +939,77 @@ class DashboardPage:
             if is_first:
                 self._initialized = True
 
-            # Always update status
-            self._status_label.text = data['status']
-
-            # Device info
-            if data['device_updated'] or is_first:
-                self._device.update(data)
-                # to show own position if changed
-                self._map.update(data)
+            # Always check status; only a changed text is queued for
+            # the browser.  Element changes made during this tick are
+            # collected in NiceGUI's per-client outbox and sent together
+            # on its next flush, so no explicit batching is needed here.
+            status = data['status']
+            if self._status_label.text != status:
+                self._status_label.text = status
+
+            # Quiet tick: the status line has no dirty bit, everything
+            # below is driven by one.  Drawer filter changes refresh the
+            # messages panel themselves (_apply_panel_side_effects).
+            if (
+                not mask
+                and not is_first
+                and self._last_channel_fingerprint is not None
+                and self._room_password_store.version == self._last_rooms_version
+            ):
+                return
 
-            # Channel-dependent UI: always ensure consistency when
-            # channels exist.  Because a single DashboardPage instance
-            # is shared across browser sessions (render() is called on
-            # each new connection), the old session's timer can steal
-            # the is_first flag before the new timer fires.  Running
-            # these unconditionally is safe because each method has an
-            # internal fingerprint/equality check that prevents
-            # unnecessary DOM updates.
-            if data['channels']:
+            # Channel-dependent UI: on every non-quiet tick, ensure
+            # consistency when channels exist.  Because a single
+            # DashboardPage instance is shared across browser sessions
+            # (render() is called on each new connection), the old
+            # session's timer can steal the is_first flag before the
+            # new timer fires.  Running these unconditionally is safe
+            # because each method has an internal fingerprint/equality
+            # check that prevents unnecessary DOM updates.
+            if channels:
                 self._messages.update_filters(data)
-                self._messages.update_channel_options(data['channels'])
+                self._messages.update_channel_options(channels)
+
+            # Drawer submenus: only when channels or rooms changed, or
+            # when render() has just created fresh (empty) containers.
+            if (
+                channels_updated
+                or is_first
+                or self._last_channel_fingerprint is None
+                or self._room_password_store.version != self._last_rooms_version
+            ):
                 self._update_submenus(data)
 
-            # BOT checkbox state (only on actual change or first render
-            # to avoid overwriting user interaction mid-toggle)
-            if data['channels_updated'] or is_first:
-                self._actions.update(data)
-
-            # Contacts
-            if data['contacts_updated'] or is_first:
-                self._contacts.update(data)
-
-            # Map
-            if data['contacts'] and (
-                data['contacts_updated'] or not self._map.has_markers or is_first
+            # Device, BOT checkbox, contacts, messages, room servers and
+            # RX log: each refreshed only when one of its bits is set or
+            # on first render.  The BOT checkbox in particular must not
+            # be overwritten mid-toggle, and drawer filter changes
+            # refresh the messages panel in _apply_panel_side_effects.
+            for bits, refresh in self._dispatch:
+                if mask & bits or is_first:
+                    refresh(data)
+
+            # Map — one update per tick covers both the own-position
+            # marker (device change) and the contact markers.  While the
+            # map is hidden its flags are parked in _map_pending and
+            # replayed by _apply_panel_side_effects('map').
+            if self._active_panel != 'map' and not is_first:
+                if device_updated:
+                    self._map_pending.add('device_updated')
+                if contacts_updated:
+                    self._map_pending.add('contacts_updated')
+            elif device_updated or is_first or (
+                contacts and (contacts_updated or not self._map_has_markers)
             ):
                 self._map.update(data)
-
-            # Messages (always — for live filter changes)
-            self._messages.update(
-                data,
-                self._messages.channel_filters,
-                self._messages.last_channels,
-                room_pubkeys=self._room_server.get_room_pubkeys() if self._room_server else None,
-            )
-
-            # Room Server panels (always — for live messages + contact changes)
-            self._room_server.update(data)
-
-            # RX Log
-            if data['rxlog_updated']:
-                self._rxlog.update(data)
+                self._map_has_markers = self._map.has_markers
 
             # Signal worker that GUI is ready for data
-            if is_first and data['channels'] and data['contacts']:
+            if is_first and channels and contacts:
                 self._shared.mark_gui_initialized()
 
-        except Exception as e:
-            err = str(e).lower()
-            if "deleted" not in err and "client" not in err:
-                import traceback
-                print(f"GUI update error: {e}")
-                traceback.print_exc()
+        except Exception:
+            # The client can still disappear mid-tick; only report
+            # errors for a live client.
+            if not self._client_gone():
+                logger.exception("GUI update error")
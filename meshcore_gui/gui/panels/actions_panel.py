@@ -1,9 +1,14 @@
 """Actions panel — refresh, advertise buttons and bot toggle."""
 
-from typing import Callable, Dict
+import threading
+from typing import Callable, Dict, Optional
 
 from nicegui import ui
 
+# Trailing-edge debounce for set_device_name: BOT toggles and name changes
+# within this window (seconds) are merged into one command to the device.
+_NAME_DEBOUNCE = 0.3
+
 
 class ActionsPanel:
     """Action buttons and bot toggle in the right column.
@@ -19,6 +24,9 @@ class ActionsPanel:
         self._bot_checkbox = None
         self._name_input = None
         self._suppress_bot_event = False
+        self._name_timer: Optional[threading.Timer] = None
+        self._name_lock = threading.Lock()
+        self._pending_name_cmd: Dict = {}
 
     def render(self) -> None:
         with ui.card().classes('w-full'):
@@ -43,7 +51,12 @@ class ActionsPanel:
             )
 
     def update(self, data: Dict) -> None:
-        """Update BOT checkbox state from snapshot data."""
+        """Update BOT checkbox state from snapshot data.
+
+        Compares against the checkbox itself, so a flag rolled back by
+        the worker (e.g. a failed set_device_name) unticks the box even
+        if no earlier snapshot carried the user's value.
+        """
         if self._bot_checkbox is not None:
             desired = data.get('bot_enabled', False)
             if self._bot_checkbox.value != desired:
@@ -62,10 +75,8 @@ class ActionsPanel:
         if self._suppress_bot_event:
             return
         self._set_bot_enabled(value)
-        self._put_command({
-            'action': 'set_device_name',
-            'bot_enabled': value,
-        })
+        # A later BOT toggle supersedes an explicit name still pending
+        self._queue_name_command(bot_enabled=value, drop_name=True)
 
     def _set_name(self) -> None:
         """Send an explicit device name update."""
@@ -74,7 +85,36 @@ class ActionsPanel:
         name = (self._name_input.value or "").strip()
         if not name:
             return
-        self._put_command({
-            'action': 'set_device_name',
-            'name': name,
-        })
+        self._queue_name_command(name=name)
+
+    def _queue_name_command(self, drop_name: bool = False, **fields) -> None:
+        """Merge *fields* into the pending set_device_name command.
+
+        The merged command is sent once the debounce window passes
+        without further changes, so a burst of BOT toggles and name
+        edits results in a single radio command.
+
+        Args:
+            drop_name: Discard a pending explicit ``name`` first.
+            **fields:  ``bot_enabled`` and/or ``name`` command fields.
+        """
+        with self._name_lock:
+            if drop_name:
+                self._pending_name_cmd.pop('name', None)
+            self._pending_name_cmd.update(fields)
+            if self._name_timer is not None:
+                self._name_timer.cancel()
+            self._name_timer = threading.Timer(
+                _NAME_DEBOUNCE, self._flush_name_command,
+            )
+            self._name_timer.daemon = True
+            self._name_timer.start()
+
+    def _flush_name_command(self) -> None:
+        """Send the merged set_device_name command (timer thread)."""
+        with self._name_lock:
+            pending = self._pending_name_cmd
+            self._pending_name_cmd = {}
+            self._name_timer = None
+        if pending:
+            self._put_command({'action': 'set_device_name', **pending})
@@ -1,14 +1,52 @@
 """Contacts panel — list of known mesh nodes with click-to-DM."""
 
+import functools
 from typing import Callable, Dict, Optional
 
 from nicegui import ui
 
-from meshcore_gui.gui.constants import TYPE_ICONS, TYPE_NAMES
+from meshcore_gui.gui.constants import icon_for, name_for
 from meshcore_gui.services.contact_cleaner import ContactCleanerService
 from meshcore_gui.services.pin_store import PinStore
 
 
+# Contact rows mounted at first, and added per step as the list is
+# scrolled towards its end.  Rows past the window are not built.
+_WINDOW_ROWS = 60
+_WINDOW_STEP = 60
+
+# Delay (s) over which list refreshes requested by the panel itself
+# (pin toggles, scrolling) are merged into one update
+_REFRESH_DELAY = 0.05
+
+# Contact row classes (pinned rows are highlighted)
+_ROW_CLASSES = (
+    'domca-contact-row w-full items-center gap-1 py-0 px-1 '
+    'rounded no-wrap'
+)
+_ROW_CLASSES_PINNED = _ROW_CLASSES + ' bg-yellow-50'
+
+# Tooltip templates, parsed once; the location lines are only added
+# for contacts that advertise a position.
+_TOOLTIP = "{name}\nType: {type_name}\nKey: {key:.16}...\nClick to send DM"
+_TOOLTIP_LOC = _TOOLTIP + "\nLat: {lat:.4f}\nLon: {lon:.4f}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _make_tooltip(
+    name: str, type_name: str, key: str, lat: float, lon: float,
+) -> str:
+    """Build the tooltip text for a contact row (memoized).
+
+    Contact data rarely changes between refreshes, so rows rebuilt for
+    a pin toggle or re-sort reuse the formatted string.
+    """
+    template = _TOOLTIP_LOC if lat != 0 or lon != 0 else _TOOLTIP
+    return template.format(
+        name=name, type_name=type_name, key=key, lat=lat, lon=lon,
+    )
+
+
 class ContactsPanel:
     """Displays contacts in the left column. Click opens a DM dialog.
 
@@ -29,16 +67,43 @@ class ContactsPanel:
         self._set_auto_add_enabled = set_auto_add_enabled
         self._on_add_room = on_add_room
         self._cleaner = ContactCleanerService(pin_store)
+        self._card = None
         self._container = None
         self._auto_add_checkbox = None
         self._last_data: Optional[Dict] = None
 
+        # Rendered rows keyed by pubkey: element handles plus 'sig',
+        # the displayed data (see _render_row)
+        self._rows: Dict[str, Dict] = {}
+        # Number of sorted rows currently mounted, and of all rows
+        self._window = _WINDOW_ROWS
+        self._total = 0
+        self._refresh_timer = None
+        # (contacts_version, pin version, window) of the last list build
+        self._list_state: Optional[tuple] = None
+        # Lowercased sort name per pubkey: {key: (name, name.lower())}
+        self._sort_names: Dict[str, tuple] = {}
+        # True while the list shows placeholder rows (see _paint_skeleton)
+        self._skeleton = False
+
+        # Purge dialog, built once in render() (see _build_purge_dialog)
+        self._purge_dialog = None
+        self._purge_label = None
+        self._purge_history_cb = None
+        self._purge_stats = None
+
+        # DM dialog, built once in render() and reused for every contact
+        self._dm_dialog = None
+        self._dm_label = None
+        self._dm_input = None
+        self._dm_target: Optional[tuple] = None
+
     def render(self) -> None:
-        with ui.card().classes('w-full'):
+        with ui.card().classes('w-full') as self._card:
             ui.label('👥 Contacts').classes('font-bold text-gray-600')
-            self._container = ui.column().classes(
-                'w-full gap-0 max-h-96 overflow-y-auto'
-            )
+            with ui.scroll_area(on_scroll=self._on_scroll).classes('w-full h-96'):
+                self._container = ui.column().classes('w-full gap-0')
+                self._paint_skeleton()
             with ui.row().classes('w-full gap-2 mt-2 items-center'):
                 ui.button(
                     '🧹 Clean up',
@@ -49,6 +114,13 @@ class ContactsPanel:
                     value=False,
                     on_change=self._on_auto_add_change,
                 )
+        self._build_purge_dialog()
+        self._build_dm_dialog()
+
+        # Row clicks arrive through one delegated page listener
+        # (dashboard head script) carrying the row's pubkey
+        ui.on('domca_contact_pin', lambda e: self._toggle_pin(e.args))
+        ui.on('domca_contact_click', lambda e: self._on_row_click(e.args))
 
     def update(self, data: Dict) -> None:
         if not self._container:
@@ -62,86 +134,223 @@ class ContactsPanel:
             if self._auto_add_checkbox.value != device_state:
                 self._auto_add_checkbox.set_value(device_state)
 
-        self._container.clear()
+        # Skip the list when neither the contacts, the pins nor the
+        # window changed since the last build
+        version = data.get('contacts_version')
+        state = (version, self._pin_store.version, self._window)
+        if version is not None and state == self._list_state:
+            return
+        self._list_state = state
 
-        # Sort: pinned contacts first, then alphabetical within each group
-        contacts_items = list(data['contacts'].items())
-        contacts_items.sort(
-            key=lambda item: (
-                0 if self._pin_store.is_pinned(item[0]) else 1,
-                item[1].get('adv_name', item[0][:12]).lower(),
+        contacts = data['contacts']
+
+        # Keep the placeholder rows until the device has sent contacts
+        if self._skeleton:
+            if not contacts:
+                return
+            self._skeleton = False
+
+        # One projection pass: (sort key, pubkey, row signature) per
+        # contact, so each field is read once.  Pins are tested against
+        # one copy of the pinned set instead of a locked lookup per key.
+        pinned_keys = self._pin_store.get_pinned()
+        old_names = self._sort_names
+        sort_names = {}
+        rows = []
+        append = rows.append
+        for key, contact in contacts.items():
+            get = contact.get
+            name = get('adv_name', key[:12])
+            pinned = key in pinned_keys
+            # Reuse the lowercased name while the name is unchanged
+            cached = old_names.get(key)
+            if cached is None or cached[0] != name:
+                cached = (name, name.lower())
+            sort_names[key] = cached
+            sig = (
+                name,
+                get('type', 0),
+                get('adv_lat', 0),
+                get('adv_lon', 0),
+                pinned,
             )
-        )
+            append(((not pinned, cached[1]), key, sig))
+        self._sort_names = sort_names
 
+        # Sort: pinned contacts first, then alphabetical within each group
+        rows.sort(key=lambda r: r[0])
+
+        # Window: only the first self._window rows are mounted.  Drop
+        # rows of contacts that are gone or fell out of the window.
+        self._total = len(rows)
+        rows = rows[:self._window]
+        mounted = {key for _, key, _ in rows}
+        for key in [k for k in self._rows if k not in mounted]:
+            self._container.remove(self._rows.pop(key)['row'])
+
+        # Keyed diff: new rows are built, changed rows are updated in
+        # place.  A pin change rebuilds the row (checkbox and styling).
+        for _, key, sig in rows:
+            entry = self._rows.get(key)
+            if entry is not None:
+                old = entry['sig']
+                if old == sig:
+                    continue
+                if old[4] == sig[4]:
+                    self._update_row(entry, key, *sig)
+                    continue
+                self._container.remove(entry['row'])
+            with self._container:
+                self._rows[key] = self._render_row(key, *sig)
+
+        # Restore sort order, moving only rows that are out of place
+        wanted = [self._rows[key]['row'] for _, key, _ in rows]
+        if self._container.default_slot.children != wanted:
+            for index, row in enumerate(wanted):
+                if self._container.default_slot.children[index] is not row:
+                    row.move(target_index=index)
+
+    def _paint_skeleton(self) -> None:
+        """Show placeholder rows for pinned contacts right away.
+
+        The device streams its contacts after connecting, so the list
+        would stay empty until then.  Pinned keys are known locally:
+        each gets a row with a short-key name, which :meth:`update`
+        fills in place once the real contact data arrives.
+        """
         with self._container:
-            for key, contact in contacts_items:
-                ctype = contact.get('type', 0)
-                icon = TYPE_ICONS.get(ctype, '○')
-                name = contact.get('adv_name', key[:12])
-                type_name = TYPE_NAMES.get(ctype, '-')
-                lat = contact.get('adv_lat', 0)
-                lon = contact.get('adv_lon', 0)
-                has_loc = lat != 0 or lon != 0
-                pinned = self._pin_store.is_pinned(key)
-
-                tooltip = (
-                    f"{name}\nType: {type_name}\n"
-                    f"Key: {key[:16]}...\nClick to send DM"
+            for key in sorted(self._pin_store.get_pinned())[:self._window]:
+                self._rows[key] = self._render_row(
+                    key, key[:12], 0, 0, 0, True,
                 )
-                if has_loc:
-                    tooltip += f"\nLat: {lat:.4f}\nLon: {lon:.4f}"
+        self._skeleton = bool(self._rows)
 
-                row_classes = (
-                    'w-full items-center gap-1 py-0 px-1 '
-                    'rounded no-wrap '
-                )
-                if pinned:
-                    row_classes += 'bg-yellow-50'
-                
-                # Outer row: checkbox + clickable contact info
-                with ui.row().classes(row_classes):
-                    # Pin checkbox — click.stop prevents DM dialog opening
-                    cb = ui.checkbox(
-                        value=pinned,
-                    ).props('dense size=xs').on(
-                        'click.stop', lambda e: None,
-                    )
-                    cb.on_value_change(
-                        lambda e, k=key: self._toggle_pin(k)
-                    )
-
-                    # Clickable area for DM
-                    with ui.row().classes(
-                        'items-center gap-0.5 flex-grow '
-                        'cursor-pointer hover:bg-gray-100 rounded py-0 px-1'
-                    ).on(
-                        'click',
-                        lambda e, k=key, n=name, t=ctype: self._on_contact_click(k, n, t),
-                    ):
-                        ui.label(icon).classes('text-sm')
-                        ui.label(name[:15]).classes(
-                            'text-sm flex-grow truncate'
-                        ).tooltip(tooltip)
-                        ui.label(type_name).classes('text-xs text-gray-500')
-                        loc_icon = '📍' if has_loc else '✖'
-                        loc_cls = 'text-xs w-4 text-center'
-                        if not has_loc:
-                            loc_cls += ' text-red-400'
-                        ui.label(loc_icon).classes(loc_cls)
+    def _render_row(
+        self,
+        key: str,
+        name: str,
+        ctype: int,
+        lat: float,
+        lon: float,
+        pinned: bool,
+    ) -> Dict:
+        """Render a single contact row and return its element handles."""
+        row_classes = _ROW_CLASSES_PINNED if pinned else _ROW_CLASSES
+
+        # Outer row: checkbox + clickable contact info.  Clicks are
+        # handled by the delegated listener via data-key, so the row
+        # registers no per-element handlers.
+        with ui.row().classes(row_classes).props(f'data-key={key}') as row:
+            # Pin checkbox — the listener reports it as a pin toggle,
+            # never as a DM click
+            ui.checkbox(value=pinned).props('dense size=xs')
+
+            # Clickable area for DM; name and type are read from the
+            # row entry, so in-place updates need no new handler
+            with ui.row().classes(
+                'domca-contact-main items-center gap-0.5 flex-grow '
+                'cursor-pointer hover:bg-gray-100 rounded py-0 px-1'
+            ):
+                icon_label = ui.label().classes('text-sm')
+                name_label = ui.label().classes('text-sm flex-grow truncate')
+                with name_label:
+                    tip = ui.tooltip()
+                type_label = ui.label().classes('text-xs text-gray-500')
+                loc_label = ui.label().classes('text-xs w-4 text-center')
+
+        entry = {
+            'row': row,
+            'icon': icon_label,
+            'name': name_label,
+            'tip': tip,
+            'type': type_label,
+            'loc': loc_label,
+        }
+        self._update_row(entry, key, name, ctype, lat, lon, pinned)
+        return entry
+
+    def _update_row(
+        self,
+        entry: Dict,
+        key: str,
+        name: str,
+        ctype: int,
+        lat: float,
+        lon: float,
+        pinned: bool,
+    ) -> None:
+        """Write the displayed contact data into a row's elements."""
+        type_name = name_for(ctype)
+        has_loc = lat != 0 or lon != 0
+        entry['icon'].text = icon_for(ctype)
+        entry['name'].text = name[:15]
+        entry['tip'].text = _make_tooltip(name, type_name, key, lat, lon)
+        entry['type'].text = type_name
+        loc = entry['loc']
+        loc.text = '📍' if has_loc else '✖'
+        if has_loc:
+            loc.classes(remove='text-red-400')
+        else:
+            loc.classes('text-red-400')
+        entry['sig'] = (name, ctype, lat, lon, pinned)
+
+    def _on_row_click(self, pubkey: str) -> None:
+        """Open the dialog for a clicked row (``domca_contact_click``).
+
+        Placeholder rows are ignored: their contact type is unknown
+        until the device sends the contact (it may be a room server).
+        """
+        if self._skeleton:
+            return
+        entry = self._rows.get(pubkey)
+        if entry is not None:
+            name, ctype = entry['sig'][:2]
+            self._on_contact_click(pubkey, name, ctype)
+
+    def _on_scroll(self, e) -> None:
+        """Mount the next rows when the list is scrolled near its end."""
+        if e.vertical_percentage < 0.9 or self._window >= self._total:
+            return
+        if self._refresh_timer is not None:
+            return
+        self._window += _WINDOW_STEP
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Refresh the list from the last data after _REFRESH_DELAY.
+
+        Requests made while a refresh is pending are merged into it.
+        """
+        if self._refresh_timer is not None or not self._last_data:
+            return
+        with self._card:
+            self._refresh_timer = ui.timer(
+                _REFRESH_DELAY, self._flush_refresh, once=True,
+            )
+
+    def _flush_refresh(self) -> None:
+        self._refresh_timer = None
+        if self._last_data:
+            self.update(self._last_data)
 
     # ------------------------------------------------------------------
     # Pin toggle
     # ------------------------------------------------------------------
 
     def _toggle_pin(self, pubkey: str) -> None:
-        """Toggle pin state for a contact and refresh the list."""
+        """Toggle pin state for a contact and refresh the list.
+
+        Called from the ``domca_contact_pin`` event; keys without a
+        rendered row are ignored.
+        """
+        if pubkey not in self._rows:
+            return
         if self._pin_store.is_pinned(pubkey):
             self._pin_store.unpin(pubkey)
         else:
             self._pin_store.pin(pubkey)
         # Re-render with last known data so sort order and visuals update
-        if self._last_data:
-            self.update(self._last_data)
+        self._schedule_refresh()
 
     # ------------------------------------------------------------------
     # Auto-add toggle
@@ -193,43 +402,13 @@ class ContactsPanel:
                 )
                 return
 
-            with ui.dialog() as dialog, ui.card().classes('w-96'):
-                ui.label('🧹 Clean up contacts').classes(
-                    'font-bold text-lg'
-                )
-                ui.label(
-                    f'{stats.unpinned_count} contacts will be removed from device.\n'
-                    f'{stats.pinned_count} pinned contacts will be kept.'
-                ).classes('whitespace-pre-line my-2')
-
-                delete_history_cb = ui.checkbox(
-                    'Also delete from local history',
-                ).props('dense')
-
-                with ui.row().classes('w-full justify-end gap-2 mt-4'):
-                    ui.button('Cancel', on_click=dialog.close).props(
-                        'flat'
-                    )
-
-                    def confirm_purge():
-                        self._put_command({
-                            'action': 'purge_unpinned',
-                            'pubkeys': stats.unpinned_keys,
-                            'delete_from_history': delete_history_cb.value,
-                        })
-                        dialog.close()
-                        ui.notify(
-                            f'Removing {stats.unpinned_count} '
-                            f'contacts...',
-                            type='info',
-                        )
-
-                    ui.button(
-                        'Remove',
-                        on_click=confirm_purge,
-                    ).classes('bg-red-500 text-white')
-
-            dialog.open()
+            self._purge_stats = stats
+            self._purge_label.text = (
+                f'{stats.unpinned_count} contacts will be removed from device.\n'
+                f'{stats.pinned_count} pinned contacts will be kept.'
+            )
+            self._purge_history_cb.value = False
+            self._purge_dialog.open()
             print("CleanUp: dialog opened successfully")
 
         except Exception as exc:
@@ -239,6 +418,44 @@ class ContactsPanel:
                 type='negative',
             )
 
+    def _build_purge_dialog(self) -> None:
+        """Create the purge dialog; its stats are set on each open."""
+        with ui.dialog() as dialog, ui.card().classes('w-96'):
+            ui.label('🧹 Clean up contacts').classes(
+                'font-bold text-lg'
+            )
+            self._purge_label = ui.label().classes('whitespace-pre-line my-2')
+
+            self._purge_history_cb = ui.checkbox(
+                'Also delete from local history',
+            ).props('dense')
+
+            with ui.row().classes('w-full justify-end gap-2 mt-4'):
+                ui.button('Cancel', on_click=dialog.close).props(
+                    'flat'
+                )
+                ui.button(
+                    'Remove',
+                    on_click=self._confirm_purge,
+                ).classes('bg-red-500 text-white')
+        self._purge_dialog = dialog
+
+    def _confirm_purge(self) -> None:
+        stats = self._purge_stats
+        if stats is None:
+            return
+        self._put_command({
+            'action': 'purge_unpinned',
+            'pubkeys': stats.unpinned_keys,
+            'delete_from_history': self._purge_history_cb.value,
+        })
+        self._purge_dialog.close()
+        ui.notify(
+            f'Removing {stats.unpinned_count} '
+            f'contacts...',
+            type='info',
+        )
+
     # ------------------------------------------------------------------
     # Contact click dispatcher
     # ------------------------------------------------------------------
@@ -290,24 +507,33 @@ class ContactsPanel:
     # DM dialog
     # ------------------------------------------------------------------
 
-    def _open_dm_dialog(self, pubkey: str, contact_name: str) -> None:
+    def _build_dm_dialog(self) -> None:
+        """Create the DM dialog; its target is set on each open."""
         with ui.dialog() as dialog, ui.card().classes('w-96'):
-            ui.label(f'💬 DM to {contact_name}').classes('font-bold text-lg')
-            msg_input = ui.input(placeholder='Type your message...').classes('w-full')
+            self._dm_label = ui.label().classes('font-bold text-lg')
+            self._dm_input = ui.input(placeholder='Type your message...').classes('w-full')
 
             with ui.row().classes('w-full justify-end gap-2 mt-4'):
                 ui.button('Cancel', on_click=dialog.close).props('flat')
+                ui.button('Send', on_click=self._send_dm).classes('bg-blue-500 text-white')
+        self._dm_dialog = dialog
 
-                def send_dm():
-                    text = msg_input.value
-                    if text:
-                        self._put_command({
-                            'action': 'send_dm',
-                            'pubkey': pubkey,
-                            'text': text,
-                            'contact_name': contact_name,
-                        })
-                        dialog.close()
-
-                ui.button('Send', on_click=send_dm).classes('bg-blue-500 text-white')
-        dialog.open()
+    def _open_dm_dialog(self, pubkey: str, contact_name: str) -> None:
+        if self._dm_dialog is None:
+            return
+        self._dm_target = (pubkey, contact_name)
+        self._dm_label.text = f'💬 DM to {contact_name}'
+        self._dm_input.value = ''
+        self._dm_dialog.open()
+
+    def _send_dm(self) -> None:
+        text = self._dm_input.value
+        if text and self._dm_target:
+            pubkey, contact_name = self._dm_target
+            self._put_command({
+                'action': 'send_dm',
+                'pubkey': pubkey,
+                'text': text,
+                'contact_name': contact_name,
+            })
+            self._dm_dialog.close()
@@ -10,6 +10,7 @@ class DevicePanel:
 
     def __init__(self) -> None:
         self._label = None
+        self._last_info = None
 
     def render(self) -> None:
         with ui.card().classes('w-full'):
@@ -22,19 +23,34 @@ class DevicePanel:
         if not self._label:
             return
 
+        # Skip formatting while the device info is unchanged
+        info = (
+            data['name'], data['public_key'], data['radio_freq'],
+            data['radio_sf'], data['radio_bw'], data['tx_power'],
+            data['adv_lat'], data['adv_lon'], data['firmware_version'],
+        )
+        if info == self._last_info:
+            return
+        self._last_info = info
+        (name, public_key, radio_freq, radio_sf, radio_bw, tx_power,
+         adv_lat, adv_lon, firmware_version) = info
+
         lines = []
-        if data['name']:
-            lines.append(f"📡 {data['name']}")
-        if data['public_key']:
-            lines.append(f"🔑 {data['public_key'][:16]}...")
-        if data['radio_freq']:
-            lines.append(f"📻 {data['radio_freq']:.3f} MHz")
-            lines.append(f"⚙️ SF{data['radio_sf']} / {data['radio_bw']} kHz")
-        if data['tx_power']:
-            lines.append(f"⚡ TX: {data['tx_power']} dBm")
-        if data['adv_lat'] and data['adv_lon']:
-            lines.append(f"📍 {data['adv_lat']:.4f}, {data['adv_lon']:.4f}")
-        if data['firmware_version']:
-            lines.append(f"🏷️ {data['firmware_version']}")
-
-        self._label.text = "\n".join(lines) if lines else "Loading..."
+        if name:
+            lines.append(f"📡 {name}")
+        if public_key:
+            lines.append(f"🔑 {public_key[:16]}...")
+        if radio_freq:
+            lines.append(f"📻 {radio_freq:.3f} MHz")
+            lines.append(f"⚙️ SF{radio_sf} / {radio_bw} kHz")
+        if tx_power:
+            lines.append(f"⚡ TX: {tx_power} dBm")
+        if adv_lat and adv_lon:
+            lines.append(f"📍 {adv_lat:.4f}, {adv_lon:.4f}")
+        if firmware_version:
+            lines.append(f"🏷️ {firmware_version}")
+
+        # Only a changed text is sent to the browser
+        text = "\n".join(lines) if lines else "Loading..."
+        if self._label.text != text:
+            self._label.text = text
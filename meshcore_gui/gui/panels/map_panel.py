@@ -1,34 +1,138 @@
 """Map panel — Leaflet map with own position and contact markers."""
 
-from typing import Dict, List
+import math
+from typing import Dict, Optional, Tuple
 
 from nicegui import ui
 
 from meshcore_gui.config import DEFAULT_MAP_CENTER, DEFAULT_MAP_ZOOM
-from meshcore_gui.gui.constants import TYPE_ICONS
+from meshcore_gui.gui.constants import icon_for
+
+
+# Delay (s) over which map re-centre requests are merged into one
+_CENTER_DELAY = 0.1
+
+# Base tile layers per map theme: (url template, layer options)
+_DARK_TILES = (
+    'https://{s}.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}{r}.png',
+    {
+        'attribution': (
+            '&copy; <a href="https://www.openstreetmap.org/copyright">'
+            'OpenStreetMap</a> contributors &copy; '
+            '<a href="https://carto.com/attributions">CARTO</a>'
+        ),
+        'maxZoom': 20,
+    },
+)
+_LIGHT_TILES = (
+    'https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png',
+    {
+        'attribution': (
+            '&copy; <a href="https://www.openstreetmap.org/copyright">'
+            'OpenStreetMap</a> contributors'
+        ),
+        'maxZoom': 19,
+    },
+)
+
+# Viewport culling: contact markers are only placed within this many
+# pixels of the map centre, per axis.  The moveend event reports centre
+# and zoom but not the element size, so the margins cover a large
+# (full-screen) map plus a pan margin.
+_CULL_HALF_WIDTH_PX = 2048
+_CULL_HALF_HEIGHT_PX = 1024
+
+# Decimals kept of contact coordinates (5 ≈ 1 m)
+_COORD_DIGITS = 5
+
+# (contacts_version, located contacts) of the last projection, shared by
+# the MapPanel of every browser session
+_located_cache: Tuple = (None, {})
+
+
+def _located_contacts(contacts: Dict, version) -> Dict[str, Tuple]:
+    """Return ``{pubkey: ((lat, lon), title)}`` for contacts with a position.
+
+    Pure data preparation (no NiceGUI calls).  The result is reused
+    while *version* matches the previous call, so several open sessions
+    project a contacts list only once.  Positions are rounded to
+    _COORD_DIGITS decimals, so GPS jitter does not move markers.
+    """
+    global _located_cache
+    if version is not None and _located_cache[0] == version:
+        return _located_cache[1]
+    located = {}
+    for key, contact in contacts.items():
+        lat = contact.get('adv_lat', 0)
+        lon = contact.get('adv_lon', 0)
+        if lat != 0 or lon != 0:
+            icon = icon_for(contact.get('type', 0))
+            latlng = (round(lat, _COORD_DIGITS), round(lon, _COORD_DIGITS))
+            located[key] = (latlng, icon + ' ' + contact.get('adv_name', key[:16]))
+    _located_cache = (version, located)
+    return located
+
+
+def _view_box(center: Tuple[float, float], zoom: float) -> Optional[Tuple]:
+    """Return ``(south, west, north, east)`` of the culling box.
+
+    Returns None when the box spans the whole world (no culling).
+    Spans use the Web Mercator scale of 256 px per 360° at zoom 0; the
+    latitude span shrinks with cos(latitude).
+    """
+    deg_per_px = 360.0 / (256 * 2 ** zoom)
+    half_lon = _CULL_HALF_WIDTH_PX * deg_per_px
+    if half_lon >= 180:
+        return None
+    lat, lon = center
+    half_lat = _CULL_HALF_HEIGHT_PX * deg_per_px * math.cos(math.radians(lat))
+    west, east = lon - half_lon, lon + half_lon
+    if west < -180 or east > 180:
+        # Box crosses the antimeridian: keep all longitudes
+        west, east = -180.0, 180.0
+    return (lat - half_lat, west, lat + half_lat, east)
 
 
 class MapPanel:
     """Interactive Leaflet map in the centre column."""
 
     def __init__(self) -> None:
+        self._card = None
         self._map = None
         self._base_layer = None
         self._active_theme = None
         self._map_theme_mode = 'auto'  # auto | dark | light
         self._ui_dark = True
         self._theme_toggle = None
-        self._contacts_markers: List = []
+        # Contact markers keyed by pubkey: {'marker', 'latlng', 'title'}
+        self._contacts_markers: Dict[str, Dict] = {}
+        # Snapshot contacts_version the markers were built from
+        # (None until the first build)
+        self._markers_version = None
+        # Located contacts of that version, and the culling box of the
+        # current view (None = whole world)
+        self._located: Dict[str, Tuple] = {}
+        self._view: Optional[Tuple] = None
         self._own_marker = None
+        # (lat, lon, name) the own marker was placed with
+        self._own_fp = None
         self._last_device_lat = None
         self._last_device_lon = None
+        # Latest requested centre and its pending one-shot timer
+        self._pending_center = None
+        self._center_timer = None
 
     @property
     def has_markers(self) -> bool:
-        return bool(self._contacts_markers)
+        """True once contact markers were placed for a contacts list.
+
+        Also true when none of the contacts has a location, so callers
+        do not keep requesting a rebuild that yields no markers.
+        """
+        return self._markers_version is not None
 
     def render(self) -> None:
-        with ui.card().classes('w-full'):
+        with ui.card().classes('w-full') as self._card:
             with ui.row().classes('w-full items-center justify-between'):
                 ui.label('🗺️ Map').classes('font-bold text-gray-600')
                 with ui.row().classes('items-center gap-2'):
@@ -43,6 +147,7 @@ class MapPanel:
                 center=DEFAULT_MAP_CENTER, zoom=DEFAULT_MAP_ZOOM
             ).classes('w-full h-72')
             self._map.clear_layers()
+            self._map.on('map-moveend', self._on_moveend)
             self._active_theme = None
             self._apply_map_theme()
 
@@ -73,25 +178,7 @@ class MapPanel:
                 pass
             self._base_layer = None
 
-        if desired == 'dark':
-            url = 'https://{s}.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}{r}.png'
-            options = {
-                'attribution': (
-                    '&copy; <a href="https://www.openstreetmap.org/copyright">'
-                    'OpenStreetMap</a> contributors &copy; '
-                    '<a href="https://carto.com/attributions">CARTO</a>'
-                ),
-                'maxZoom': 20,
-            }
-        else:
-            url = 'https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png'
-            options = {
-                'attribution': (
-                    '&copy; <a href="https://www.openstreetmap.org/copyright">'
-                    'OpenStreetMap</a> contributors'
-                ),
-                'maxZoom': 19,
-            }
+        url, options = _DARK_TILES if desired == 'dark' else _LIGHT_TILES
         self._base_layer = self._map.tile_layer(url_template=url, options=options)
         self._active_theme = desired
 
@@ -100,11 +187,33 @@ class MapPanel:
             return
         if self._last_device_lat is None or self._last_device_lon is None:
             return
+        self._schedule_center(self._last_device_lat, self._last_device_lon)
+
+    def _schedule_center(self, lat: float, lon: float) -> None:
+        """Re-centre the map on (*lat*, *lon*) after _CENTER_DELAY.
+
+        Requests made while one is pending only replace the target, so
+        a burst of position updates costs one invalidateSize and one
+        set_center.
+        """
+        self._pending_center = (lat, lon)
+        if self._center_timer is not None:
+            return
+        with self._card:
+            self._center_timer = ui.timer(
+                _CENTER_DELAY, self._flush_center, once=True,
+            )
+
+    def _flush_center(self) -> None:
+        self._center_timer = None
+        center, self._pending_center = self._pending_center, None
+        if not self._map or center is None:
+            return
         try:
             self._map.run_method('invalidateSize')
         except Exception:
             pass
-        self._map.set_center((self._last_device_lat, self._last_device_lon))
+        self._map.set_center(center)
 
     def update(self, data: Dict) -> None:
         if not self._map:
@@ -112,37 +221,93 @@ class MapPanel:
 
         # Own position
         force_center = bool(data.get('force_center', False))
+        adv_lat = data['adv_lat']
+        adv_lon = data['adv_lon']
         if (
             (data['device_updated'] or self._own_marker is None or force_center)
-            and (data['adv_lat'] and data['adv_lon'])
+            and (adv_lat and adv_lon)
         ):
-            self._last_device_lat = data['adv_lat']
-            self._last_device_lon = data['adv_lon']
-            try:
-                self._map.remove_layer(self._own_marker)
-            except Exception:
-                pass
-            self._own_marker = self._map.marker(latlng=(data['adv_lat'], data['adv_lon']), options={'title': '📡 ' + data['name']})
-            try:
-                self._map.run_method('invalidateSize')
-            except Exception:
-                pass
-            self._map.set_center((data['adv_lat'], data['adv_lon']))
-
-        # Contact markers
-        if data['contacts_updated'] or not self.has_markers:
-            # Remove old markers
-            for marker in self._contacts_markers:
+            self._last_device_lat = adv_lat
+            self._last_device_lon = adv_lon
+            # Device updates that leave position and name unchanged keep
+            # the marker (and the user's view) unless forced
+            own_fp = (adv_lat, adv_lon, data['name'])
+            if own_fp != self._own_fp or self._own_marker is None:
+                # A rename alone keeps the view; only a new position
+                # (or the first placement) re-centres
+                moved = self._own_fp is None or own_fp[:2] != self._own_fp[:2]
+                self._own_fp = own_fp
                 try:
-                    self._map.remove_layer(marker)
+                    self._map.remove_layer(self._own_marker)
                 except Exception:
                     pass
-            self._contacts_markers.clear()
-
-            for key, contact in data['contacts'].items():
-                lat = contact.get('adv_lat', 0)
-                lon = contact.get('adv_lon', 0)
-                if lat != 0 or lon != 0:
-                    icon = TYPE_ICONS.get(contact.get('type', 0), '○')
-                    marker = self._map.marker(latlng=(lat, lon), options={'title': icon + ' ' + contact.get('adv_name', key[:16])})
-                    self._contacts_markers.append(marker)
+                self._own_marker = self._map.marker(latlng=(adv_lat, adv_lon), options={'title': '📡 ' + data['name']})
+                if moved or force_center:
+                    self._schedule_center(adv_lat, adv_lon)
+            elif force_center:
+                self._schedule_center(adv_lat, adv_lon)
+
+        # Contact markers: rebuilt when the contacts list changed since
+        # the last build (located-contact filtering runs once per version)
+        version = data.get('contacts_version')
+        if (
+            data['contacts_updated']
+            or self._markers_version is None
+            or version != self._markers_version
+        ):
+            self._located = _located_contacts(data['contacts'], version)
+            self._sync_markers()
+            self._markers_version = version
+
+    def _on_moveend(self, e) -> None:
+        """Re-cull contact markers after the view was panned or zoomed."""
+        args = e.args if isinstance(e.args, dict) else {}
+        center = args.get('center')
+        zoom = args.get('zoom')
+        if isinstance(center, dict):
+            center = (center.get('lat'), center.get('lng'))
+        if not center or None in center or zoom is None:
+            return
+        view = _view_box(tuple(center), zoom)
+        if view != self._view:
+            self._view = view
+            if self._markers_version is not None:
+                self._sync_markers()
+
+    def _sync_markers(self) -> None:
+        """Diff the placed markers against the located contacts in view."""
+        located = self._located
+        view = self._view
+        if view is not None:
+            south, west, north, east = view
+            located = {
+                key: item for key, item in located.items()
+                if south <= item[0][0] <= north and west <= item[0][1] <= east
+            }
+
+        # Remove vanished contacts, move contacts whose position
+        # changed, add new ones.  A changed title needs a new marker
+        # (options are fixed).
+        markers = self._contacts_markers
+        for key in markers.keys() - located.keys():
+            self._remove_marker(markers.pop(key)['marker'])
+        for key, (latlng, title) in located.items():
+            entry = markers.get(key)
+            if entry is not None:
+                if entry['title'] == title:
+                    if entry['latlng'] != latlng:
+                        entry['marker'].move(*latlng)
+                        entry['latlng'] = latlng
+                    continue
+                self._remove_marker(entry['marker'])
+            markers[key] = {
+                'marker': self._map.marker(latlng=latlng, options={'title': title}),
+                'latlng': latlng,
+                'title': title,
+            }
+
+    def _remove_marker(self, marker) -> None:
+        try:
+            self._map.remove_layer(marker)
+        except Exception:
+            pass
@@ -1,11 +1,14 @@
 """Messages panel — filtered message display with channel selection and message input."""
 
-from typing import Callable, Dict, List, Set
+from typing import Callable, Dict, FrozenSet, List, Set
 
 from nicegui import ui
 
 from meshcore_gui.core.models import Message
 
+# Number of most recent matching messages shown
+_MAX_LINES = 50
+
 
 class MessagesPanel:
     """Displays filtered messages with channel selection and message input.
@@ -26,6 +29,19 @@ class MessagesPanel:
         self._msg_input = None
         self._channel_select = None
         self._last_fingerprint = None  # skip rebuild when unchanged
+        self._last_input_key = None  # skip filtering when inputs unchanged
+        # Rendered lines keyed by id(msg): [label, msg, route key]; the
+        # message is kept so its id cannot be reused while listed
+        self._labels: Dict[int, list] = {}
+        # (channel names, hide channel tag) the lines were rendered with
+        self._labels_ctx = None
+        # Channel (idx, name) pairs and the idx -> name dict built from them
+        self._channel_names_sig = None
+        self._channel_names: Dict = {}
+        # Room pubkey set and its prefix set (see _room_prefixes)
+        self._room_pks_ref = None
+        self._room_prefix_set: FrozenSet[str] = frozenset()
+        self._options_sig = None  # (idx, name) per channel in the dropdown
 
         # Active channel set by drawer submenu (None = all)
         self._active_channel = None
@@ -54,6 +70,7 @@ class MessagesPanel:
         """
         self._active_channel = channel
         self._last_fingerprint = None  # force rebuild on next update
+        self._last_input_key = None
 
         # Update the header label
         if self._channel_label:
@@ -100,6 +117,10 @@ class MessagesPanel:
                     'Send', on_click=self._send_message
                 ).classes('bg-blue-500 text-white')
 
+        # Line clicks arrive through the delegated listener in the page
+        # head instead of one handler per label
+        ui.on('domca_msg_click', lambda e: self._on_line_click(e.args))
+
     # -- Filter data update (keeps channel list up to date) ------------
 
     def update_filters(self, data: Dict) -> None:
@@ -124,14 +145,17 @@ class MessagesPanel:
     def update_channel_options(self, channels: List[Dict]) -> None:
         """Update the channel dropdown options.
 
-        Includes an equality check to avoid sending redundant updates
-        to the NiceGUI client on every 500 ms timer tick.
+        Compares the channels' (idx, name) signature first, so an
+        unchanged list neither rebuilds the options dict nor sends a
+        redundant update to the NiceGUI client.
         """
         if not self._channel_select or not channels:
             return
-        opts = {ch['idx']: f"[{ch['idx']}] {ch['name']}" for ch in channels}
-        if self._channel_select.options == opts:
+        sig = tuple((ch['idx'], ch['name']) for ch in channels)
+        if sig == self._options_sig:
             return  # unchanged — skip DOM update
+        self._options_sig = sig
+        opts = {ch['idx']: f"[{ch['idx']}] {ch['name']}" for ch in channels}
         self._channel_select.options = opts
         if self._channel_select.value not in opts:
             self._channel_select.value = list(opts.keys())[0]
@@ -153,19 +177,26 @@ class MessagesPanel:
     # -- Message display -----------------------------------------------
 
     @staticmethod
-    def _is_room_message(msg: Message, room_pubkeys: Set[str]) -> bool:
+    def _room_prefixes(room_pubkeys: Set[str]) -> FrozenSet[str]:
+        """Return every 1..16 character prefix of the room pubkeys.
+
+        A sender matches a room when one key starts with the other's
+        first 16 characters (same logic as RoomServerPanel).  With all
+        short prefixes in one set that is a single lookup of
+        ``sender_pubkey[:16]``, for short sender prefixes as well.
+        """
+        return frozenset(
+            rpk[:n] for rpk in room_pubkeys for n in range(1, 17)
+        )
+
+    @staticmethod
+    def _is_room_message(msg: Message, room_prefixes: FrozenSet[str]) -> bool:
         """Return True if *msg* belongs to a Room Server.
 
-        Matches when the message's ``sender_pubkey`` prefix-matches
-        any tracked room pubkey (same logic as RoomServerPanel).
+        *room_prefixes* comes from :meth:`_room_prefixes`.
         """
-        if not msg.sender_pubkey or not room_pubkeys:
-            return False
-        for rpk in room_pubkeys:
-            if (msg.sender_pubkey.startswith(rpk[:16])
-                    or rpk.startswith(msg.sender_pubkey[:16])):
-                return True
-        return False
+        sender = msg.sender_pubkey
+        return bool(sender) and sender[:16] in room_prefixes
 
     def update(
         self,
@@ -195,58 +226,132 @@ class MessagesPanel:
             return
 
         room_pks = room_pubkeys or set()
-        channel_names = {ch['idx']: ch['name'] for ch in last_channels}
+
+        # Skip filtering entirely when none of its inputs changed: the
+        # message list (by version), the channel filter, the room set,
+        # the channel names and the legacy checkbox states
+        input_key = (
+            data.get('messages_version', id(data['messages'])),
+            self._active_channel,
+            frozenset(room_pks),
+            tuple((ch['idx'], ch['name']) for ch in last_channels),
+            tuple((k, cb.value) for k, cb in channel_filters.items()),
+        )
+        if input_key == self._last_input_key:
+            return
+        self._last_input_key = input_key
+
+        if input_key[3] != self._channel_names_sig:
+            self._channel_names_sig = input_key[3]
+            self._channel_names = dict(input_key[3])
+        channel_names = self._channel_names
         messages: List[Message] = data['messages']
 
-        # Apply filters
+        # The room set is a cached frozenset, so identity tells whether
+        # the prefixes need recomputing
+        if room_pks is not self._room_pks_ref:
+            self._room_pks_ref = room_pks
+            self._room_prefix_set = self._room_prefixes(room_pks)
+        room_prefixes = self._room_prefix_set
+
+        # Compile the channel filter once.  An active channel (from the
+        # drawer submenu) shows only that channel; DMs have channel
+        # None.  Without one (ALL), the legacy checkboxes hide the
+        # channels that are unchecked.
+        active = self._active_channel
+        if active is not None:
+            only_channel = None if active == 'DM' else active
+            hidden = None
+        else:
+            hidden = {
+                None if key == 'DM' else key
+                for key, cb in channel_filters.items() if not cb.value
+            }
+
+        # Apply filters, walking from the newest message and stopping
+        # once _MAX_LINES have matched (older ones are never shown)
         filtered = []
-        for orig_idx, msg in enumerate(messages):
+        is_room_message = self._is_room_message
+        for orig_idx in range(len(messages) - 1, -1, -1):
+            msg = messages[orig_idx]
             # Skip room server messages (shown in RoomServerPanel)
-            if self._is_room_message(msg, room_pks):
+            if is_room_message(msg, room_prefixes):
                 continue
 
-            # Apply active channel filter (from drawer submenu)
-            if self._active_channel is not None:
-                if self._active_channel == 'DM':
-                    # Show only DM messages (channel is None)
-                    if msg.channel is not None:
-                        continue
-                else:
-                    # Show only messages for specific channel index
-                    if msg.channel != self._active_channel:
-                        continue
-            else:
-                # No active channel filter (ALL) — use checkbox filters
-                # as fallback for backwards compatibility
-                if msg.channel is None:
-                    if channel_filters.get('DM') and not channel_filters['DM'].value:
-                        continue
-                else:
-                    if msg.channel in channel_filters and not channel_filters[msg.channel].value:
-                        continue
+            if hidden is None:
+                if msg.channel != only_channel:
+                    continue
+            elif msg.channel in hidden:
+                continue
 
             filtered.append((orig_idx, msg))
-
-        # Rebuild only when content changed
-        fingerprint = tuple((orig_idx, id(msg)) for orig_idx, msg in filtered)
+            if len(filtered) == _MAX_LINES:
+                break
+
+        # Rebuild only when content changed (channel names are part of
+        # the rendered lines).  List indexes are included because lines
+        # without a message hash route by index.
+        fingerprint = (
+            tuple((orig_idx, id(msg)) for orig_idx, msg in filtered),
+            input_key[3],
+        )
         if fingerprint == self._last_fingerprint:
             return
         self._last_fingerprint = fingerprint
 
-        self._container.clear()
+        # Hide channel tag when viewing a specific channel/DM
+        hide_ch = self._active_channel is not None
+
+        # Lines depend on the channel names and the tag setting; when
+        # those change every line is rendered again
+        ctx = (input_key[3], hide_ch)
+        if ctx != self._labels_ctx:
+            self._labels_ctx = ctx
+            self._container.clear()
+            self._labels = {}
+
+        # Newest first (the order filtered is already in): drop lines
+        # that left the window, create lines only for new messages, then
+        # restore the order.  Lines are keyed by message identity, since
+        # list indexes shift once the buffer is full and drops its oldest.
+        keys = {id(msg) for _, msg in filtered}
+        for key in [k for k in self._labels if k not in keys]:
+            self._container.remove(self._labels.pop(key)[0])
+
+        for orig_idx, msg in filtered:
+            # Route pages resolve a hash wherever the message moved;
+            # lines without one route by their current index
+            route = msg.message_hash or str(orig_idx)
+            entry = self._labels.get(id(msg))
+            if entry is not None:
+                if entry[2] != route:
+                    entry[0].props(f'data-route={route}')
+                    entry[2] = route
+                continue
+            line = msg.format_line(channel_names, show_channel=not hide_ch)
+            with self._container:
+                label = ui.label(line).classes(
+                    'domca-msg-line text-xs leading-tight cursor-pointer '
+                    'hover:bg-blue-50 rounded px-1'
+                ).props(f'data-route={route}')
+            self._labels[id(msg)] = [label, msg, route]
 
-        with self._container:
-            # Hide channel tag when viewing a specific channel/DM
-            hide_ch = self._active_channel is not None
+        wanted = [self._labels[id(msg)][0] for _, msg in filtered]
+        children = self._container.default_slot.children
+        if children != wanted:
+            for index, label in enumerate(wanted):
+                if children[index] is not label:
+                    label.move(target_index=index)
 
-            for orig_idx, msg in reversed(filtered[-50:]):
-                line = msg.format_line(channel_names, show_channel=not hide_ch)
+    def _on_line_click(self, route) -> None:
+        """Open the route page of a clicked line (``domca_msg_click``).
 
-                ui.label(line).classes(
-                    'text-xs leading-tight cursor-pointer '
-                    'hover:bg-blue-50 rounded px-1'
-                ).on('click', lambda e, i=orig_idx: self._open_route(i))
+        *route* is the line's message hash, or its list index when the
+        message has no hash (both accepted by the route page).
+        """
+        if isinstance(route, str) and route:
+            self._open_route(route)
 
     @staticmethod
-    def _open_route(msg_index: int) -> None:
-        ui.navigate.to(f'/route/{msg_index}')
+    def _open_route(msg_key: str) -> None:
+        ui.navigate.to(f'/route/{msg_key}')
@@ -1,6 +1,6 @@
 """Room Server panel — per-room messaging with login and password storage."""
 
-from typing import Callable, Dict, List, Set
+from typing import Callable, Dict, FrozenSet, List, Optional, Set
 
 from nicegui import ui
 
@@ -35,9 +35,19 @@ class RoomServerPanel:
         # Per-room UI state keyed by pubkey
         self._room_cards: Dict[str, Dict] = {}
 
+        # Cached result of get_room_pubkeys(); reset when a card is
+        # added or removed
+        self._pubkeys_cache: Optional[FrozenSet[str]] = None
+
         # Login state tracked locally (not persisted)
         self._logged_in: Set[str] = set()
 
+        # Bumped by local changes (cards, login/logout clicks) so that
+        # update() also reruns when the snapshot versions are unchanged
+        self._local_version = 0
+        # (rooms_version, messages_version, local version) last applied
+        self._last_update_key = None
+
     # ------------------------------------------------------------------
     # Render — restore persisted rooms on startup
     # ------------------------------------------------------------------
@@ -87,13 +97,16 @@ class RoomServerPanel:
         if pubkey in self._room_cards:
             self._login_room(self._room_cards[pubkey], pubkey)
 
-    def get_room_pubkeys(self) -> Set[str]:
+    def get_room_pubkeys(self) -> FrozenSet[str]:
         """Return the set of all room server pubkeys currently tracked.
 
         Used by :class:`MessagesPanel` to filter out room messages from
-        the general DM view.
+        the general DM view.  The set is rebuilt only after a room card
+        was added or removed; otherwise the cached one is returned.
         """
-        return set(self._room_cards.keys())
+        if self._pubkeys_cache is None:
+            self._pubkeys_cache = frozenset(self._room_cards)
+        return self._pubkeys_cache
 
     # ------------------------------------------------------------------
     # Update (called from dashboard timer)
@@ -108,18 +121,34 @@ class RoomServerPanel:
         if not self._container:
             return
 
+        # Nothing to do while neither the room data, the messages nor
+        # the cards changed since the last update
+        update_key = (
+            data.get('rooms_version'),
+            data.get('messages_version'),
+            self._local_version,
+        )
+        if None not in update_key[:2] and update_key == self._last_update_key:
+            return
+        self._last_update_key = update_key
+
         # Process room login state changes from the worker
         login_states: Dict = data.get('room_login_states', {})
         self._apply_login_states(login_states)
 
         # Room messages from archive cache (keyed by 12-char pubkey prefix)
         room_messages: Dict = data.get('room_messages', {})
-        # Live messages from current session's rolling buffer
+        # Live messages from current session's rolling buffer, split
+        # per room in one pass
         live_messages: List[Message] = data.get('messages', [])
+        live_by_room = self._live_by_room(
+            live_messages, {pubkey[:12] for pubkey in self._room_cards},
+        )
 
         for pubkey, card_state in self._room_cards.items():
             self._update_room_messages(
-                pubkey, card_state, room_messages, live_messages,
+                pubkey, card_state, room_messages,
+                live_by_room.get(pubkey[:12], []),
             )
 
     # ------------------------------------------------------------------
@@ -137,13 +166,32 @@ class RoomServerPanel:
             login_states: ``{pubkey_prefix: {'state': str, 'detail': str}}``
                           from SharedData.
         """
+        # Index the states by their first 12 hex chars (SharedData keeps
+        # one key per 12-char prefix).  Any key that matches a room
+        # shares those chars with it, so each room needs one lookup plus
+        # the exact check.  Shorter keys are rare and scanned instead.
+        by_prefix: Dict[str, tuple] = {}
+        short_keys: List[tuple] = []
+        for prefix, state_info in login_states.items():
+            if len(prefix) >= 12:
+                # First match only; prevents stale keys overriding
+                by_prefix.setdefault(prefix[:12], (prefix, state_info))
+            else:
+                short_keys.append((prefix, state_info))
+
+        # (card_state, status text, logged-in view or None) per card
+        transitions: List[tuple] = []
         for pubkey, card_state in self._room_cards.items():
             # Find matching login state (prefix match)
             matched_state = None
-            for prefix, state_info in login_states.items():
+            candidates = short_keys
+            entry = by_prefix.get(pubkey[:12])
+            if entry is not None:
+                candidates = [entry] + short_keys
+            for prefix, state_info in candidates:
                 if pubkey.startswith(prefix) or prefix.startswith(pubkey[:16]):
                     matched_state = state_info
-                    break  # Use first match only; prevents stale keys overriding
+                    break
 
             if matched_state is None:
                 continue
@@ -153,39 +201,64 @@ class RoomServerPanel:
             if state == 'ok' and pubkey not in self._logged_in:
                 # Server confirmed login
                 self._logged_in.add(pubkey)
-                card_state['status'].text = (
-                    '✅ Logged in — history arriving over RF…'
-                )
-                card_state['pw_row'].set_visibility(False)
-                card_state['logout_btn'].set_visibility(True)
-                card_state['login_btn'].enable()
-                card_state['msg_input'].enable()
-                card_state['send_btn'].enable()
+                transitions.append((
+                    card_state,
+                    '✅ Logged in — history arriving over RF…',
+                    True,
+                ))
 
             elif state == 'fail' and pubkey not in self._logged_in:
                 # Login failed or timed out — revert to login form
                 detail = matched_state.get('detail', 'Unknown error')
-                card_state['status'].text = f'❌ Login failed: {detail}'
-                card_state['pw_row'].set_visibility(True)
-                card_state['logout_btn'].set_visibility(False)
-                card_state['login_btn'].enable()
-                card_state['msg_input'].disable()
-                card_state['send_btn'].disable()
+                transitions.append(
+                    (card_state, f'❌ Login failed: {detail}', False),
+                )
 
             elif state == 'pending':
-                card_state['status'].text = '⏳ Logging in…'
+                transitions.append((card_state, '⏳ Logging in…', None))
 
             elif state == 'logged_out' and pubkey in self._logged_in:
                 # Server confirmed logout — ensure UI is fully reset
                 # (catches edge cases where _logout_room UI update was
                 # overridden by a stale 'ok' state from previous tick)
                 self._logged_in.discard(pubkey)
-                card_state['status'].text = '⏳ Not logged in'
-                card_state['pw_row'].set_visibility(True)
-                card_state['logout_btn'].set_visibility(False)
-                card_state['login_btn'].enable()
-                card_state['msg_input'].disable()
-                card_state['send_btn'].disable()
+                transitions.append((card_state, '⏳ Not logged in', False))
+
+        # Apply the card changes together once all states are matched
+        for card_state, status, logged_in in transitions:
+            self._set_card_view(card_state, status, logged_in)
+
+    @staticmethod
+    def _set_card_view(
+        card_state: Dict, status: str, logged_in: Optional[bool],
+    ) -> None:
+        """Set a card's status text and its login-dependent controls.
+
+        Values equal to the ones last applied (mirrored in the card
+        state) are not written again, so a steady 'pending' or 'fail'
+        state sends nothing to the browser.
+
+        Args:
+            card_state: UI state dict of the room card.
+            status:     Status label text.
+            logged_in:  True shows the logout button and enables
+                        sending, False shows the login form and
+                        disables sending, None changes only the status.
+        """
+        if status != card_state['view_status']:
+            card_state['status'].text = status
+            card_state['view_status'] = status
+        if logged_in is None or logged_in == card_state['view_logged_in']:
+            return
+        card_state['view_logged_in'] = logged_in
+        card_state['pw_row'].set_visibility(not logged_in)
+        card_state['logout_btn'].set_visibility(logged_in)
+        card_state['login_btn'].enable()
+        for key in ('msg_input', 'send_btn'):
+            if logged_in:
+                card_state[key].enable()
+            else:
+                card_state[key].disable()
 
     # ------------------------------------------------------------------
     # Internal — single room card
@@ -255,12 +328,21 @@ class RoomServerPanel:
                 '✅ Logged in' if is_logged_in
                 else '⏳ Not logged in'
             ).classes('text-xs text-gray-500')
+            # Status text and logged-in view last applied to the card
+            # (see _set_card_view)
+            card_state['view_status'] = card_state['status'].text
+            card_state['view_logged_in'] = is_logged_in
 
             # Messages container (scrollable)
             card_state['msg_container'] = ui.column().classes(
                 'w-full h-32 overflow-y-auto gap-0 text-sm font-mono '
                 'bg-gray-50 p-2 rounded'
             )
+            # (time, text, direction, sender) per shown message; None
+            # until the first render
+            card_state['last_render_key'] = None
+            # Shown labels keyed by that per-message tuple
+            card_state['labels'] = {}
 
             # Send row
             with ui.row().classes('w-full items-center gap-2'):
@@ -279,6 +361,8 @@ class RoomServerPanel:
                 card_state['send_btn'].disable()
 
         self._room_cards[pubkey] = card_state
+        self._pubkeys_cache = None
+        self._local_version += 1
 
     # ------------------------------------------------------------------
     # Internal — actions
@@ -319,6 +403,9 @@ class RoomServerPanel:
         # Pending UI update — real state comes from SharedData
         card_state['status'].text = '⏳ Logging in…'
         card_state['login_btn'].disable()
+        card_state['view_status'] = card_state['status'].text
+        card_state['view_logged_in'] = None  # login button now differs
+        self._local_version += 1
 
         ui.notify(f'Logging in to {name}...', type='info')
 
@@ -339,18 +426,16 @@ class RoomServerPanel:
         })
 
         self._logged_in.discard(pubkey)
+        self._local_version += 1
 
         # Clear messages — user should not see room history after logout
         msg_container = card_state.get('msg_container')
         if msg_container:
             msg_container.clear()
+            card_state['last_render_key'] = ()
+            card_state['labels'] = {}
 
-        card_state['status'].text = '⏳ Not logged in'
-        card_state['pw_row'].set_visibility(True)
-        card_state['logout_btn'].set_visibility(False)
-        card_state['login_btn'].enable()
-        card_state['msg_input'].disable()
-        card_state['send_btn'].disable()
+        self._set_card_view(card_state, '⏳ Not logged in', False)
 
         ui.notify(f'Logged out from {name}', type='info')
 
@@ -386,6 +471,8 @@ class RoomServerPanel:
         self._logged_in.discard(pubkey)
 
         card_state = self._room_cards.pop(pubkey, None)
+        self._pubkeys_cache = None
+        self._local_version += 1
         if card_state and card_state.get('card'):
             self._container.remove(card_state['card'])
 
@@ -393,12 +480,42 @@ class RoomServerPanel:
     # Internal — message display
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _live_by_room(
+        live_messages: List[Message], norms: Set[str],
+    ) -> Dict[str, List[Message]]:
+        """Group live messages by the 12-char room prefix they belong to.
+
+        A message belongs to a room when its sender pubkey starts with
+        the room's 12-char prefix, or is a shorter prefix of it.  Each
+        list keeps the rolling buffer's order.
+
+        Args:
+            live_messages: Current session's rolling message buffer.
+            norms:         12-char pubkey prefixes of the room cards.
+        """
+        by_room: Dict[str, List[Message]] = {}
+        if not norms:
+            return by_room
+        for msg in live_messages:
+            sender = msg.sender_pubkey
+            if not sender:
+                continue
+            if len(sender) >= 12:
+                if sender[:12] in norms:
+                    by_room.setdefault(sender[:12], []).append(msg)
+            else:
+                for norm in norms:
+                    if norm.startswith(sender):
+                        by_room.setdefault(norm, []).append(msg)
+        return by_room
+
     def _update_room_messages(
         self,
         pubkey: str,
         card_state: Dict,
         room_messages: Dict,
-        live_messages: List[Message],
+        live_room: List[Message],
     ) -> None:
         """Update the message display for a single room card.
 
@@ -411,7 +528,8 @@ class RoomServerPanel:
             pubkey:         Full public key of the room server.
             card_state:     UI state dict for this room card.
             room_messages:  ``{12-char-prefix: [Message, …]}`` from archive cache.
-            live_messages:  Current session's rolling message buffer.
+            live_room:      This room's live messages (see
+                            :meth:`_live_by_room`).
         """
         msg_container = card_state.get('msg_container')
         if not msg_container:
@@ -419,7 +537,10 @@ class RoomServerPanel:
 
         # Login gate — show nothing before login
         if pubkey not in self._logged_in:
-            msg_container.clear()
+            if card_state['last_render_key'] != ():
+                msg_container.clear()
+                card_state['last_render_key'] = ()
+                card_state['labels'] = {}
             return
 
         norm = pubkey[:12]
@@ -427,37 +548,53 @@ class RoomServerPanel:
         # 1. Archived room messages (loaded from disk cache)
         archived: List[Message] = room_messages.get(norm, [])
 
-        # 2. Live room messages from rolling buffer (current session)
-        live_room: List[Message] = []
-        for msg in live_messages:
-            if not msg.sender_pubkey:
-                continue
-            if (msg.sender_pubkey.startswith(norm)
-                    or norm.startswith(msg.sender_pubkey[:12])):
-                live_room.append(msg)
+        # 2. Live room messages (current session) arrive as live_room
 
         # 3. Merge and dedup (archive may already contain live messages
-        #    because add_message() appends to both)
-        seen = set()
-        merged: List[Message] = []
-        for msg in archived + live_room:
-            key = (msg.time, msg.text)
-            if key not in seen:
-                seen.add(key)
-                merged.append(msg)
+        #    because add_message() appends to both); the dict keeps the
+        #    first message per (time, text) in insertion order
+        merged: Dict[tuple, Message] = {}
+        for msg in archived:
+            merged.setdefault((msg.time, msg.text), msg)
+        for msg in live_room:
+            merged.setdefault((msg.time, msg.text), msg)
 
         # 4. Take last 30 then reverse: newest message at top
-        display = merged[-30:]
+        display = list(merged.values())[-30:]
         display.reverse()
 
-        msg_container.clear()
-
-        with msg_container:
-            for msg in display:
-                direction = '→' if msg.direction == 'out' else '←'
-                sender = msg.sender or '?'
-                line = f"{msg.time} {direction} {sender}: {msg.text}"
+        # Leave the labels alone when the shown messages are unchanged
+        render_key = tuple(
+            (msg.time, msg.text, msg.direction, msg.sender) for msg in display
+        )
+        if render_key == card_state['last_render_key']:
+            return
+        card_state['last_render_key'] = render_key
+
+        # Usually only the newest message or two are new: drop labels
+        # that left the list, create labels for new messages, then
+        # restore the newest-first order
+        labels: Dict[tuple, ui.label] = card_state['labels']
+        wanted_keys = set(render_key)
+        for key in [k for k in labels if k not in wanted_keys]:
+            msg_container.remove(labels.pop(key))
+
+        for key in render_key:
+            if key in labels:
+                continue
+            msg_time, text, msg_direction, msg_sender = key
+            direction = '→' if msg_direction == 'out' else '←'
+            sender = msg_sender or '?'
+            line = f"{msg_time} {direction} {sender}: {text}"
 
-                ui.label(line).classes(
+            with msg_container:
+                labels[key] = ui.label(line).classes(
                     'text-xs leading-tight px-1'
                 )
+
+        wanted = [labels[key] for key in render_key]
+        children = msg_container.default_slot.children
+        if children != wanted:
+            for index, label in enumerate(wanted):
+                if children[index] is not label:
+                    label.move(target_index=index)
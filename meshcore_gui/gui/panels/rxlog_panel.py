@@ -12,6 +12,11 @@ class RxLogPanel:
 
     def __init__(self) -> None:
         self._table = None
+        # Snapshot rxlog_version the table rows were built from
+        self._last_version = None
+        # Shown rows keyed by id(entry): (entry, row dict); the entry is
+        # kept so its id cannot be reused while shown
+        self._rows: Dict[int, tuple] = {}
 
     # ------------------------------------------------------------------
     # Helpers
@@ -81,17 +86,30 @@ class RxLogPanel:
     def update(self, data: Dict) -> None:
         if not self._table:
             return
+        version = data.get('rxlog_version')
+        if version is not None and version == self._last_version:
+            return  # unchanged — skip rebuilding the rows
+        self._last_version = version
         entries: List[RxLogEntry] = data['rx_log'][:20]
-        rows = [
-            {
-                'time': e.time,
-                'snr': f"{e.snr:.1f}",
-                'rssi': f"{e.rssi:.0f}",
-                'type': e.payload_type,
-                'hops': str(e.hops),
-                'path': self._build_path(e),
-            }
-            for e in entries
-        ]
-        self._table.rows = rows
+
+        # Same 20 entries in the same order: the table is current
+        if [id(e) for e in entries] == list(self._rows):
+            return
+
+        # Format only entries that were not shown yet
+        cached = self._rows
+        self._rows = {}
+        for e in entries:
+            item = cached.get(id(e))
+            if item is None:
+                item = (e, {
+                    'time': e.time,
+                    'snr': f"{e.snr:.1f}",
+                    'rssi': f"{e.rssi:.0f}",
+                    'type': e.payload_type,
+                    'hops': str(e.hops),
+                    'path': self._build_path(e),
+                })
+            self._rows[id(e)] = item
+        self._table.rows = [row for _, row in self._rows.values()]
         self._table.update()
@@ -14,7 +14,7 @@ from typing import Dict, List, Optional
 
 from nicegui import ui
 
-from meshcore_gui.gui.constants import TYPE_LABELS
+from meshcore_gui.gui.constants import label_for
 from meshcore_gui.gui.dashboard import _DOMCA_HEAD
 from meshcore_gui.config import debug_print, DEFAULT_MAP_CENTER, DEFAULT_MAP_ZOOM
 from meshcore_gui.core.models import Message, RouteNode
@@ -241,7 +241,7 @@ class RoutePage:
                     'hop': 'Start',
                     'name': sender.name,
                     'hash': sender.pubkey[:2].upper() if sender.pubkey else '-',
-                    'type': TYPE_LABELS.get(sender.type, '-'),
+                    'type': label_for(sender.type),
                     'location': f"{sender.lat:.4f}, {sender.lon:.4f}" if sender.has_location else '-',
                     'role': '📱 Sender',
                 })
@@ -259,7 +259,7 @@ class RoutePage:
                         'hop': 'Start',
                         'name': fb_c.get('adv_name') or msg.sender or 'Unknown',
                         'hash': fb_key[:2].upper() if fb_key else '-',
-                        'type': TYPE_LABELS.get(fb_c.get('type', 0), '-'),
+                        'type': label_for(fb_c.get('type', 0)),
                         'location': f"{fb_lat:.4f}, {fb_lon:.4f}" if fb_has_loc else '-',
                         'role': '📱 Sender',
                     })
@@ -279,7 +279,7 @@ class RoutePage:
                     'hop': str(i + 1),
                     'name': node.name,
                     'hash': node.pubkey[:2].upper() if node.pubkey else '-',
-                    'type': TYPE_LABELS.get(node.type, '-'),
+                    'type': label_for(node.type),
                     'location': f"{node.lat:.4f}, {node.lon:.4f}" if node.has_location else '-',
                     'role': '📡 Repeater',
                 })
@@ -9,11 +9,12 @@ displays results.
 Thread safety
 ~~~~~~~~~~~~~
 Methods read from SharedData (thread-safe) and PinStore (thread-safe).
-No mutable state is stored in this service.
+The only mutable state is the last computed PurgeStats, which is
+replaced as a whole (see ``get_purge_stats``).
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from meshcore_gui.services.pin_store import PinStore
 
@@ -47,29 +48,43 @@ class ContactCleanerService:
 
     def __init__(self, pin_store: PinStore) -> None:
         self._pin_store = pin_store
+        # (contacts dict, PinStore.version, stats) of the last call
+        self._cached: Optional[Tuple[Dict, int, PurgeStats]] = None
 
     def get_purge_stats(self, contacts: Dict) -> PurgeStats:
         """Calculate which contacts would be purged.
 
-        Iterates all contacts and separates them into pinned (kept)
-        and unpinned (to be removed).
+        Separates the contacts into pinned (kept) and unpinned (to be
+        removed) with one pass against a copy of the pinned set.
 
         Args:
             contacts: Contacts dict from SharedData snapshot
                       (``{pubkey: contact_dict}``).
 
         Returns:
-            PurgeStats with the list of unpinned keys and counts.
+            PurgeStats with the list of unpinned keys and counts.  The
+            same instance is returned again for the same *contacts*
+            object (snapshots share it while contacts are unchanged)
+            as long as no pin changed in between.
         """
-        pinned_keys: Set[str] = self._pin_store.get_pinned()
-        unpinned_keys: List[str] = []
+        pin_version = self._pin_store.version
+        cached = self._cached
+        if (
+            cached is not None
+            and cached[0] is contacts
+            and cached[1] == pin_version
+        ):
+            return cached[2]
 
-        for pubkey in contacts:
-            if pubkey not in pinned_keys:
-                unpinned_keys.append(pubkey)
+        pinned_keys: Set[str] = self._pin_store.get_pinned()
+        unpinned_keys: List[str] = [
+            pubkey for pubkey in contacts if pubkey not in pinned_keys
+        ]
 
-        return PurgeStats(
+        stats = PurgeStats(
             unpinned_keys=unpinned_keys,
             pinned_count=len(contacts) - len(unpinned_keys),
             total_count=len(contacts),
         )
+        self._cached = (contacts, pin_version, stats)
+        return stats
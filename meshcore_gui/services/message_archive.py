@@ -22,11 +22,12 @@ All methods use an internal lock for thread-safe operation.
 The lock is separate from SharedData's lock to avoid contention.
 """
 
+import heapq
 import json
 import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from meshcore_gui.config import (
     MESSAGE_RETENTION_DAYS,
@@ -73,6 +74,10 @@ class MessageArchive:
         # Stats
         self._total_messages = 0
         self._total_rxlog = 0
+
+        # Bumped whenever the set of archived messages changes, so
+        # readers can cache query results until the next change.
+        self._messages_version = 0
         
         # Load existing archives
         self._load_archives()
@@ -139,6 +144,7 @@ class MessageArchive:
             }
             
             self._message_buffer.append(msg_dict)
+            self._messages_version += 1
             
             # Flush if batch size reached
             if len(self._message_buffer) >= self._batch_size:
@@ -359,6 +365,7 @@ class MessageArchive:
                 
                 removed = original_count - len(filtered)
                 self._total_messages = len(filtered)
+                self._messages_version += 1
                 debug_print(
                     f"Archive: cleanup removed {removed} old messages "
                     f"(retained: {len(filtered)})"
@@ -523,6 +530,16 @@ class MessageArchive:
     # Stats
     # ------------------------------------------------------------------
 
+    @property
+    def messages_version(self) -> int:
+        """Change counter for archived messages.
+
+        Incremented on every added message and on retention cleanup.
+        Query results may be cached for as long as this value is
+        unchanged.
+        """
+        return self._messages_version
+
     def get_stats(self) -> Dict:
         """Get archive statistics.
         
@@ -585,6 +602,118 @@ class MessageArchive:
                 )
                 return []
 
+    @staticmethod
+    def _iter_matching(
+        messages: Iterable[Dict],
+        after: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+        channel_name: Optional[str] = None,
+        sender: Optional[str] = None,
+        text_search: Optional[str] = None,
+        dm_only: bool = False,
+    ) -> Iterator[Dict]:
+        """Yield the messages from *messages* that pass all filters.
+
+        Shared filter logic for :meth:`query_messages` and
+        :meth:`iter_messages`; see those methods for the arguments.
+        """
+        # Normalise search terms once instead of per message
+        sender_lc = sender.lower() if sender else None
+        text_lc = text_search.lower() if text_search else None
+
+        for msg in messages:
+            # Time filters
+            if after or before:
+                try:
+                    msg_time = datetime.fromisoformat(msg.get("timestamp_utc", ""))
+                    if after and msg_time < after:
+                        continue
+                    if before and msg_time > before:
+                        continue
+                except (ValueError, TypeError):
+                    continue
+
+            # DM filter (no channel index)
+            if dm_only and msg.get("channel") is not None:
+                continue
+
+            # Channel name filter (exact match)
+            if channel_name is not None:
+                if msg.get("channel_name", "") != channel_name:
+                    continue
+
+            # Sender filter (case-insensitive substring)
+            if sender_lc:
+                if sender_lc not in msg.get("sender", "").lower():
+                    continue
+
+            # Text search (case-insensitive substring)
+            if text_lc:
+                if text_lc not in msg.get("text", "").lower():
+                    continue
+
+            yield msg
+
+    def _read_messages(self) -> List[Dict]:
+        """Flush and read all archived messages (MUST be called with lock held)."""
+        self._flush_messages()
+
+        if not self._messages_path.exists():
+            return []
+
+        data = json.loads(self._messages_path.read_text(encoding="utf-8"))
+        if data.get("version") != ARCHIVE_VERSION:
+            return []
+        return data.get("messages", [])
+
+    def iter_messages(
+        self,
+        after: Optional[datetime] = None,
+        before: Optional[datetime] = None,
+        channel_name: Optional[str] = None,
+        sender: Optional[str] = None,
+        text_search: Optional[str] = None,
+        dm_only: bool = False,
+    ) -> Iterator[Dict]:
+        """Lazily iterate archived messages matching the filters, newest first.
+
+        Unlike :meth:`query_messages` no filtered list is built: matches
+        are produced one at a time, so callers can take a page with
+        ``itertools.islice`` and stop early.  The archive file is read
+        under the lock; filtering happens lazily after it is released.
+
+        Messages are appended in arrival order (``timestamp_utc`` is set
+        at add time), so walking the stored list backwards yields them
+        newest first without sorting.
+
+        Args:
+            after: Only messages after this timestamp (UTC).
+            before: Only messages before this timestamp (UTC).
+            channel_name: Filter by channel name (exact match).
+            sender: Filter by sender name (case-insensitive substring match).
+            text_search: Search in message text (case-insensitive substring match).
+            dm_only: Only direct messages (``channel`` is ``None``).
+
+        Returns:
+            Iterator over matching message dicts, newest first.
+        """
+        with self._lock:
+            try:
+                messages = self._read_messages()
+            except (json.JSONDecodeError, OSError) as exc:
+                debug_print(f"Archive: error iterating messages: {exc}")
+                messages = []
+
+        return self._iter_matching(
+            reversed(messages),
+            after=after,
+            before=before,
+            channel_name=channel_name,
+            sender=sender,
+            text_search=text_search,
+            dm_only=dm_only,
+        )
+
     def query_messages(
         self,
         after: Optional[datetime] = None,
@@ -612,63 +741,31 @@ class MessageArchive:
             - total_count: Total number of messages matching filters (for pagination)
         """
         with self._lock:
-            # Flush pending writes first
-            self._flush_messages()
-            
-            if not self._messages_path.exists():
-                return [], 0
-            
             try:
-                data = json.loads(self._messages_path.read_text(encoding="utf-8"))
-                if data.get("version") != ARCHIVE_VERSION:
-                    return [], 0
-                
-                messages = data.get("messages", [])
-                
-                # Apply filters
-                filtered = []
-                for msg in messages:
-                    # Time filters
-                    if after or before:
-                        try:
-                            msg_time = datetime.fromisoformat(msg.get("timestamp_utc", ""))
-                            if after and msg_time < after:
-                                continue
-                            if before and msg_time > before:
-                                continue
-                        except (ValueError, TypeError):
-                            continue
-                    
-                    # Channel name filter (exact match)
-                    if channel_name is not None:
-                        if msg.get("channel_name", "") != channel_name:
-                            continue
-                    
-                    # Sender filter (case-insensitive substring)
-                    if sender:
-                        msg_sender = msg.get("sender", "")
-                        if sender.lower() not in msg_sender.lower():
-                            continue
-                    
-                    # Text search (case-insensitive substring)
-                    if text_search:
-                        msg_text = msg.get("text", "")
-                        if text_search.lower() not in msg_text.lower():
-                            continue
-                    
-                    filtered.append(msg)
-                
-                # Sort newest first
-                filtered.sort(
+                messages = self._read_messages()
+
+                # Apply filters; the match count is taken in the same
+                # pass so no second scan is needed for pagination.
+                filtered = list(self._iter_matching(
+                    messages,
+                    after=after,
+                    before=before,
+                    channel_name=channel_name,
+                    sender=sender,
+                    text_search=text_search,
+                ))
+
+                total_count = len(filtered)
+
+                # Newest first, but only order as many rows as the
+                # requested page needs (equivalent to a full sort + slice)
+                newest = heapq.nlargest(
+                    offset + limit,
+                    filtered,
                     key=lambda m: m.get("timestamp_utc", ""),
-                    reverse=True
                 )
-                
-                total_count = len(filtered)
-                
-                # Apply pagination
-                paginated = filtered[offset:offset + limit]
-                
+                paginated = newest[offset:offset + limit]
+
                 return paginated, total_count
                 
             except (json.JSONDecodeError, OSError) as exc:
@@ -42,12 +42,24 @@ class PinStore:
         self._path = PINS_DIR / f"{safe_name}_pins.json"
         self._pinned: Set[str] = set()
 
+        # Bumped when a contact is pinned or unpinned (see :attr:`version`)
+        self._version = 0
+
         self._load()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    @property
+    def version(self) -> int:
+        """Change counter for the set of pinned contacts.
+
+        Incremented by :meth:`pin` and :meth:`unpin`, so the GUI can
+        skip re-sorting the contacts list while it is unchanged.
+        """
+        return self._version
+
     def is_pinned(self, pubkey: str) -> bool:
         """Check if a contact is pinned.
 
@@ -68,6 +80,7 @@ class PinStore:
         """
         with self._lock:
             self._pinned.add(pubkey)
+            self._version += 1
             self._save()
             debug_print(f"PinStore: pinned {pubkey[:16]}")
 
@@ -79,6 +92,7 @@ class PinStore:
         """
         with self._lock:
             self._pinned.discard(pubkey)
+            self._version += 1
             self._save()
             debug_print(f"PinStore: unpinned {pubkey[:16]}")
 
@@ -55,12 +55,24 @@ class RoomPasswordStore:
         self._path = ROOM_PASSWORDS_DIR / f"{safe_name}_rooms.json"
         self._rooms: Dict[str, RoomServerEntry] = {}
 
+        # Bumped when a room is added or removed (see :attr:`version`)
+        self._version = 0
+
         self._load()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    @property
+    def version(self) -> int:
+        """Change counter for the set of configured rooms.
+
+        Incremented by :meth:`add_room` and :meth:`remove_room`, so
+        the GUI can skip rebuilding room menus while it is unchanged.
+        """
+        return self._version
+
     def get_rooms(self) -> List[RoomServerEntry]:
         """Return a list of all configured Room Server entries.
 
@@ -115,6 +127,7 @@ class RoomPasswordStore:
                 name=name,
                 password=password,
             )
+            self._version += 1
             self._save()
             debug_print(
                 f"RoomPasswordStore: added/updated {name} "
@@ -147,6 +160,7 @@ class RoomPasswordStore:
             if pubkey in self._rooms:
                 name = self._rooms[pubkey].name
                 del self._rooms[pubkey]
+                self._version += 1
                 self._save()
                 debug_print(
                     f"RoomPasswordStore: removed {name} "
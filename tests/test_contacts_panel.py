@@ -0,0 +1,98 @@
+"""
+Tests for ContactsPanel list updates.
+
+Tests cover:
+- Placeholder rows for pinned contacts (skeleton) and the first update
+
+Requires NiceGUI; the tests are skipped when it is not installed.
+"""
+
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+HAS_NICEGUI = importlib.util.find_spec("nicegui") is not None
+
+PIN_A = "aa" * 32
+PIN_B = "bb" * 32
+OTHER = "cc" * 32
+
+
+@unittest.skipUnless(HAS_NICEGUI, "nicegui is not installed")
+class TestContactsPanelSkeleton(unittest.TestCase):
+    """Tests for the skeleton rows painted before contacts arrive."""
+
+    def setUp(self):
+        """Render a ContactsPanel with two pinned contacts."""
+        from nicegui import Client
+        from nicegui.page import page
+
+        from meshcore_gui.gui.panels.contacts_panel import ContactsPanel
+        from meshcore_gui.services.pin_store import PinStore
+
+        self.temp_dir = tempfile.mkdtemp()
+        store = PinStore("test:contacts-panel")
+        store._path = Path(self.temp_dir) / "pins.json"
+        store.pin(PIN_A)
+        store.pin(PIN_B)
+
+        self.clicks = []
+        self.client = Client(page("/"), request=None)
+        with self.client:
+            self.panel = ContactsPanel(lambda cmd: None, store, lambda v: None)
+            self.panel._on_contact_click = (
+                lambda key, name, ctype: self.clicks.append(key)
+            )
+            self.panel.render()
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        import shutil
+        if Path(self.temp_dir).exists():
+            shutil.rmtree(self.temp_dir)
+
+    def _children(self):
+        return self.panel._container.default_slot.children
+
+    def _rows(self, *keys):
+        return [self.panel._rows[key]["row"] for key in keys]
+
+    def test_skeleton_rows_are_in_the_list(self):
+        """Test placeholder rows are children of the list column."""
+        self.assertTrue(self.panel._skeleton)
+        self.assertEqual(self._children(), self._rows(PIN_A, PIN_B))
+
+    def test_skeleton_rows_ignore_clicks(self):
+        """Test a placeholder row does not open a contact dialog."""
+        self.panel._on_row_click(PIN_A)
+        self.assertEqual(self.clicks, [])
+
+    def test_first_update_fills_skeleton_rows_in_order(self):
+        """Test the first update keeps pinned rows in the list, sorted."""
+        skeleton_row = self.panel._rows[PIN_A]["row"]
+        data = {
+            "contacts": {
+                PIN_A: {"adv_name": "Zulu", "type": 1},
+                PIN_B: {"adv_name": "Alpha", "type": 1},
+                OTHER: {"adv_name": "Mike", "type": 1},
+            },
+            "contacts_version": 1,
+            "auto_add_enabled": False,
+        }
+        with self.client:
+            self.panel.update(data)
+
+        self.assertFalse(self.panel._skeleton)
+        # Pinned first (alphabetical), then the unpinned contact
+        self.assertEqual(self._children(), self._rows(PIN_B, PIN_A, OTHER))
+        # The placeholder row was filled in place, not rebuilt
+        self.assertIs(self.panel._rows[PIN_A]["row"], skeleton_row)
+        self.assertEqual(self.panel._rows[PIN_A]["sig"][0], "Zulu")
+
+        self.panel._on_row_click(PIN_A)
+        self.assertEqual(self.clicks, [PIN_A])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -246,6 +246,46 @@ class TestMessageArchive(unittest.TestCase):
         self.assertEqual(data["entries"][0]["payload_type"], "NEW")
         self.assertEqual(data["entries"][0]["message_hash"], "new456")
 
+    # ------------------------------------------------------------------
+    # Query tests
+    # ------------------------------------------------------------------
+
+    def test_query_messages_pagination(self):
+        """Test newest-first paging and total count in one query."""
+        for i in range(5):
+            msg = Message(
+                time=f"12:34:{i:02d}",
+                sender="PE1HVH" if i % 2 else "Other",
+                text=f"Message {i}",
+                channel=0,
+                direction="in",
+            )
+            self.archive.add_message(msg)
+            time.sleep(0.001)  # distinct timestamp_utc values
+
+        page, total = self.archive.query_messages(limit=2, offset=1)
+        self.assertEqual(total, 5)
+        self.assertEqual([m["text"] for m in page], ["Message 3", "Message 2"])
+
+        page, total = self.archive.query_messages(sender="pe1hvh", limit=10)
+        self.assertEqual(total, 2)
+        self.assertEqual([m["text"] for m in page], ["Message 3", "Message 1"])
+
+    def test_iter_messages_dm_only(self):
+        """Test lazy newest-first iteration with the DM filter."""
+        for i in range(4):
+            msg = Message(
+                time=f"12:34:{i:02d}",
+                sender="PE1HVH",
+                text=f"Message {i}",
+                channel=None if i % 2 else 0,
+                direction="in",
+            )
+            self.archive.add_message(msg)
+
+        texts = [m["text"] for m in self.archive.iter_messages(dm_only=True)]
+        self.assertEqual(texts, ["Message 3", "Message 1"])
+
     # ------------------------------------------------------------------
     # Stats tests
     # ------------------------------------------------------------------
@@ -290,6 +330,24 @@ class TestMessageArchive(unittest.TestCase):
         self.assertEqual(stats["total_messages"], 3)
         self.assertEqual(stats["total_rxlog"], 2)
 
+    def test_messages_version(self):
+        """Test that the messages version changes on every add."""
+        v0 = self.archive.messages_version
+        msg = Message(
+            time="12:34:56",
+            sender="PE1HVH",
+            text="Version bump",
+            channel=0,
+            direction="in",
+        )
+        self.archive.add_message(msg)
+        self.assertGreater(self.archive.messages_version, v0)
+
+        # Flushing does not change the archived message set
+        v1 = self.archive.messages_version
+        self.archive.flush()
+        self.assertEqual(self.archive.messages_version, v1)
+
     # ------------------------------------------------------------------
     # Thread safety tests
     # ------------------------------------------------------------------
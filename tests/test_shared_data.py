@@ -0,0 +1,136 @@
+"""
+Unit tests for SharedData snapshots.
+
+Tests cover:
+- Reuse of unchanged snapshot sections
+- The dirty_flags bitmask
+- Update flag reset by get_snapshot_and_clear_flags
+"""
+
+import unittest
+
+from meshcore_gui.core.models import Message, RxLogEntry
+from meshcore_gui.core.protocols import (
+    DIRTY_CHANNELS,
+    DIRTY_CONTACTS,
+    DIRTY_DEVICE,
+    DIRTY_RXLOG,
+)
+from meshcore_gui.core.shared_data import SharedData
+
+
+class TestSharedDataSnapshot(unittest.TestCase):
+    """Tests for SharedData snapshot building."""
+
+    def setUp(self):
+        """Create SharedData without archive and drain the initial flags."""
+        self.shared = SharedData()
+        self.shared.get_snapshot_and_clear_flags()
+
+    @staticmethod
+    def _message(text: str) -> Message:
+        return Message(
+            time="12:34:56",
+            sender="PE1HVH",
+            text=text,
+            channel=0,
+            direction="in",
+        )
+
+    # ------------------------------------------------------------------
+    # Section reuse
+    # ------------------------------------------------------------------
+
+    def test_snapshot_reuses_unchanged_sections(self):
+        """Test snapshot copies are shared until their section changes."""
+        self.shared.add_message(self._message("First"))
+
+        first = self.shared.get_snapshot()
+        second = self.shared.get_snapshot()
+        self.assertIs(first["messages"], second["messages"])
+        self.assertEqual(first["messages_version"], second["messages_version"])
+
+        self.shared.add_message(self._message("Second"))
+        third = self.shared.get_snapshot()
+        self.assertIsNot(third["messages"], second["messages"])
+        self.assertGreater(third["messages_version"], second["messages_version"])
+        self.assertEqual(len(second["messages"]), 1)
+        self.assertEqual(len(third["messages"]), 2)
+
+        # Other sections are untouched
+        self.assertIs(third["rx_log"], first["rx_log"])
+
+    # ------------------------------------------------------------------
+    # Dirty flags
+    # ------------------------------------------------------------------
+
+    def test_initial_snapshot_is_fully_dirty(self):
+        """Test a fresh SharedData reports every section as changed."""
+        snapshot = SharedData().get_snapshot()
+        self.assertEqual(
+            snapshot["dirty_flags"],
+            DIRTY_DEVICE | DIRTY_CONTACTS | DIRTY_CHANNELS | DIRTY_RXLOG,
+        )
+
+    def test_dirty_flags_match_update_flags(self):
+        """Test each update sets only its own dirty bit."""
+        cases = [
+            (lambda: self.shared.update_from_appstart({"name": "Node"}),
+             DIRTY_DEVICE, "device_updated"),
+            (lambda: self.shared.set_contacts({"aa": {"adv_name": "A"}}),
+             DIRTY_CONTACTS, "contacts_updated"),
+            (lambda: self.shared.set_channels([{"idx": 0, "name": "Public"}]),
+             DIRTY_CHANNELS, "channels_updated"),
+            (lambda: self.shared.add_rx_log(RxLogEntry(time="12:34:56")),
+             DIRTY_RXLOG, "rxlog_updated"),
+        ]
+        for update, bit, flag in cases:
+            with self.subTest(flag=flag):
+                update()
+                snapshot = self.shared.get_snapshot_and_clear_flags()
+                self.assertEqual(snapshot["dirty_flags"], bit)
+                self.assertTrue(snapshot[flag])
+
+    def test_combined_updates_set_combined_bits(self):
+        """Test several updates between snapshots are OR-ed together."""
+        self.shared.set_contacts({})
+        self.shared.add_rx_log(RxLogEntry(time="12:34:56"))
+        snapshot = self.shared.get_snapshot()
+        self.assertEqual(snapshot["dirty_flags"], DIRTY_CONTACTS | DIRTY_RXLOG)
+
+    # ------------------------------------------------------------------
+    # Flag reset
+    # ------------------------------------------------------------------
+
+    def test_clear_flags_resets_after_dirty_snapshot(self):
+        """Test a dirty snapshot is reported once, then flags are reset."""
+        self.shared.set_channels([{"idx": 0, "name": "Public"}])
+        first = self.shared.get_snapshot_and_clear_flags()
+        self.assertEqual(first["dirty_flags"], DIRTY_CHANNELS)
+
+        second = self.shared.get_snapshot_and_clear_flags()
+        self.assertEqual(second["dirty_flags"], 0)
+        self.assertFalse(self.shared.channels_updated)
+
+    def test_idle_snapshot_keeps_flags_clear(self):
+        """Test idle snapshots report no changes and reuse all sections."""
+        first = self.shared.get_snapshot_and_clear_flags()
+        second = self.shared.get_snapshot_and_clear_flags()
+
+        for snapshot in (first, second):
+            self.assertEqual(snapshot["dirty_flags"], 0)
+            self.assertFalse(snapshot["device_updated"])
+            self.assertFalse(snapshot["contacts_updated"])
+            self.assertFalse(snapshot["channels_updated"])
+            self.assertFalse(snapshot["rxlog_updated"])
+        for section in ("contacts", "channels", "messages", "rx_log"):
+            self.assertIs(first[section], second[section])
+
+        # An update after idle ticks is still reported
+        self.shared.add_rx_log(RxLogEntry(time="12:34:57"))
+        third = self.shared.get_snapshot_and_clear_flags()
+        self.assertEqual(third["dirty_flags"], DIRTY_RXLOG)
+
+
+if __name__ == "__main__":
+    unittest.main()